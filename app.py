@@ -1,11 +1,18 @@
+import io
+import hashlib
 import streamlit as st
 import pandas as pd
 import numpy as np
-from disc_cutting_analyzer.data_loader import get_all_data, get_available_materials, get_available_cut_types
+import plotly.graph_objects as go
+from typing import Callable
+from disc_cutting_analyzer.data_loader import (
+    get_all_data, load_uploaded_data,
+    get_available_materials, get_available_cut_types
+)
 from disc_cutting_analyzer.plotting import (
     create_chipping_plot, create_performance_plot, 
     create_process_parameters_plot, create_disc_parameters_plot, 
-    create_summary_metrics
+    create_summary_metrics, SummaryMetrics
 )
 from disc_cutting_analyzer.analysis import (
     filter_data, get_material_statistics, 
@@ -14,6 +21,202 @@ from disc_cutting_analyzer.analysis import (
 )
 from disc_cutting_analyzer.decrypting import get_article_info, validate_article_format
 
+# Rows sent to the browser in the data table; the CSV download keeps all rows
+MAX_DISPLAY_ROWS = 1000
+
+
+@st.cache_data(show_spinner=False)
+def _load_default() -> pd.DataFrame:
+    """
+    Load the bundled database once and reuse it across reruns.
+    
+    Returns:
+        pd.DataFrame: Combined data from the default Excel file
+    """
+    return get_all_data()
+
+
+@st.cache_data(show_spinner=False)
+def _load_uploaded(file_bytes: bytes) -> pd.DataFrame:
+    """
+    Parse and clean an uploaded workbook once per distinct file content.
+    
+    Args:
+        file_bytes (bytes): Raw content of the uploaded XLSX file
+        
+    Returns:
+        pd.DataFrame: Combined data from all sheets in the uploaded file
+    """
+    return load_uploaded_data(io.BytesIO(file_bytes))
+
+
+@st.cache_data(show_spinner=False)
+def _available_options(_data: pd.DataFrame, data_key: str) -> tuple:
+    """
+    Compute the material and cut type choices once per data source.
+    
+    Args:
+        _data (pd.DataFrame): Loaded data (not hashed)
+        data_key (str): Identifier of the loaded data source
+        
+    Returns:
+        tuple: (available materials, available cut types)
+    """
+    return get_available_materials(_data), get_available_cut_types(_data)
+
+
+@st.cache_data(show_spinner=False)
+def _cached_filter(
+    _data: pd.DataFrame,
+    data_key: str,
+    materials: tuple,
+    cut_types: tuple,
+    min_thickness: float,
+    max_thickness: float,
+    min_kerf_width: float,
+    max_kerf_width: float
+) -> pd.DataFrame:
+    """
+    Memoize filter_data per data source and widget state.
+    
+    The DataFrame itself is excluded from hashing (leading underscore);
+    data_key identifies the loaded source instead.
+    
+    Args:
+        _data (pd.DataFrame): Loaded data (not hashed)
+        data_key (str): Identifier of the loaded data source
+        materials (tuple): Sorted selected materials
+        cut_types (tuple): Sorted selected cut types
+        min_thickness (float): Minimum thickness for filtering
+        max_thickness (float): Maximum thickness for filtering
+        min_kerf_width (float): Minimum kerf width for filtering
+        max_kerf_width (float): Maximum kerf width for filtering
+        
+    Returns:
+        pd.DataFrame: Filtered DataFrame
+    """
+    # Both loaders return the rows in thickness order
+    return filter_data(
+        _data, list(materials), list(cut_types),
+        min_thickness, max_thickness, min_kerf_width, max_kerf_width,
+        thickness_sorted=True
+    )
+
+
+@st.cache_data(show_spinner=False)
+def _cached_summary_metrics(_filtered_data: pd.DataFrame, data_key: str, filter_key: tuple) -> SummaryMetrics:
+    """
+    Memoize create_summary_metrics per data source and widget state.
+    
+    Args:
+        _filtered_data (pd.DataFrame): Data already filtered by filter_key (not hashed)
+        data_key (str): Identifier of the loaded data source
+        filter_key (tuple): Hashable filter state the data was filtered with
+        
+    Returns:
+        SummaryMetrics: Calculated metrics
+    """
+    return create_summary_metrics(_filtered_data)
+
+
+@st.cache_data(show_spinner=False)
+def _cached_statistics(_filtered_data: pd.DataFrame, data_key: str, filter_key: tuple) -> tuple:
+    """
+    Memoize the per-material and per-cut-type tables per data source and widget state.
+    
+    Both tables are built together, so reruns that keep the filters (e.g.
+    the article decoder) skip both groupby passes.
+    
+    Args:
+        _filtered_data (pd.DataFrame): Data already filtered by filter_key (not hashed)
+        data_key (str): Identifier of the loaded data source
+        filter_key (tuple): Hashable filter state the data was filtered with
+        
+    Returns:
+        tuple: (material statistics, cut type analysis) DataFrames
+    """
+    return get_material_statistics(_filtered_data), get_cut_type_analysis(_filtered_data)
+
+
+@st.cache_data(show_spinner=False)
+def _csv_bytes(_filtered_data: pd.DataFrame, data_key: str, filter_key: tuple) -> bytes:
+    """
+    Serialize the filtered data to CSV once per data source and widget state.
+    
+    Args:
+        _filtered_data (pd.DataFrame): Data already filtered by filter_key (not hashed)
+        data_key (str): Identifier of the loaded data source
+        filter_key (tuple): Hashable filter state the data was filtered with
+        
+    Returns:
+        bytes: UTF-8 encoded CSV content
+    """
+    return _filtered_data.to_csv(index=False).encode("utf-8")
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _cached_figure(
+    name: str,
+    _builder: Callable[..., go.Figure],
+    _filtered_data: pd.DataFrame,
+    data_key: str,
+    filter_key: tuple
+) -> go.Figure:
+    """
+    Build a tab figure once per data source and widget state across sessions.
+    
+    Only name, data_key and filter_key are hashed; the builder and the
+    filtered data are fully determined by them.
+    
+    Args:
+        name (str): Unique figure name
+        _builder (Callable[..., go.Figure]): Plot function with the create_*_plot signature (not hashed)
+        _filtered_data (pd.DataFrame): Data already filtered by filter_key (not hashed)
+        data_key (str): Identifier of the loaded data source
+        filter_key (tuple): Hashable filter state
+        
+    Returns:
+        go.Figure: Plotly figure object
+    """
+    materials, cut_types = filter_key[:2]
+    return _builder(_filtered_data, list(materials), list(cut_types))
+
+
+def _get_figure(
+    name: str,
+    builder: Callable[..., go.Figure],
+    filtered_data: pd.DataFrame,
+    data_key: str,
+    filter_key: tuple
+) -> go.Figure:
+    """
+    Return the figure for a tab, rebuilding it only when the filters change.
+    
+    The last built figure is kept in st.session_state together with the
+    state it was built for, so reruns triggered by unrelated widgets
+    (e.g. the article decoder) skip the plot construction entirely.
+    
+    Args:
+        name (str): Unique figure name used as the session state key
+        builder (Callable[..., go.Figure]): Plot function with the create_*_plot signature
+        filtered_data (pd.DataFrame): Data already filtered by filter_key
+        data_key (str): Identifier of the loaded data source
+        filter_key (tuple): Hashable filter state
+        
+    Returns:
+        go.Figure: Plotly figure object
+    """
+    state_key = f"fig_{name}"
+    cache_key = (data_key, filter_key)
+    cached = st.session_state.get(state_key)
+    if cached is None or cached[0] != cache_key:
+        # Fall back to the shared cache before rebuilding, e.g. when a
+        # previous filter combination is selected again
+        fig = _cached_figure(name, builder, filtered_data, data_key, filter_key)
+        st.session_state[state_key] = (cache_key, fig)
+        return fig
+    return cached[1]
+
 
 def main():
     # Set page config
@@ -35,12 +238,14 @@ def main():
     
     with st.spinner("Loading data..."):
         if uploaded_file is not None:
-            # If user uploads a file, use it
-            from disc_cutting_analyzer.data_loader import load_uploaded_data
-            data = load_uploaded_data(uploaded_file)
+            # If user uploads a file, use it (cached by file content)
+            file_bytes = uploaded_file.getvalue()
+            data_key = hashlib.md5(file_bytes).hexdigest()
+            data = _load_uploaded(file_bytes)
         else:
             # Otherwise use the default data
-            data = get_all_data()
+            data_key = "default"
+            data = _load_default()
     
     if data.empty:
         st.error("Не удалось загрузить данные. Пожалуйста, проверьте наличие файла данных.")
@@ -50,8 +255,7 @@ def main():
     st.sidebar.header("Фильтры данных")
     
     # Get available materials and cut types
-    available_materials = get_available_materials(data)
-    available_cut_types = get_available_cut_types(data)
+    available_materials, available_cut_types = _available_options(data, data_key)
     
     # Material selection
     selected_materials = st.sidebar.multiselect(
@@ -89,27 +293,21 @@ def main():
         step=5
     )
     
-    # Filter data based on selections
-    filtered_data = filter_data(
-        data,
-        selected_materials,
-        selected_cut_types,
+    # Hashable, order-insensitive filter state used as the cache key
+    filter_key = (
+        tuple(sorted(selected_materials)),
+        tuple(sorted(selected_cut_types)),
         thickness_range[0],
         thickness_range[1],
         kerf_width_range[0],
         kerf_width_range[1]
     )
     
+    # Filter data once; metrics and plots all reuse the same selection
+    filtered_data = _cached_filter(data, data_key, *filter_key)
+    
     # Calculate summary metrics
-    metrics = create_summary_metrics(
-        data,
-        selected_materials,
-        selected_cut_types,
-        thickness_range[0],
-        thickness_range[1],
-        kerf_width_range[0],
-        kerf_width_range[1]
-    )
+    metrics = _cached_summary_metrics(filtered_data, data_key, filter_key)
     
     # Display metrics
     st.subheader("Ключевые показатели")
@@ -118,31 +316,31 @@ def main():
     with col1:
         st.metric(
             label="Средние сколы (лицевая сторона)",
-            value=f"{metrics['avg_front_chipping']:.2f} мкм"
+            value=f"{metrics.avg_front_chipping:.2f} мкм"
         )
     
     with col2:
         st.metric(
             label="Средние сколы (обратная сторона)",
-            value=f"{metrics['avg_back_chipping']:.2f} мкм" if metrics['avg_back_chipping'] > 0 else "Нет данных"
+            value=f"{metrics.avg_back_chipping:.2f} мкм" if metrics.avg_back_chipping > 0 else "Нет данных"
         )
     
     with col3:
         st.metric(
             label="Средняя производительность",
-            value=f"{metrics['avg_performance']:.2f} шт/час"
+            value=f"{metrics.avg_performance:.2f} шт/час"
         )
     
     with col4:
         st.metric(
             label="Средний срок службы диска",
-            value=f"{metrics['avg_blade_life']:.2f} резов"
+            value=f"{metrics.avg_blade_life:.2f} резов"
         )
     
     with col5:
         st.metric(
             label="Всего записей",
-            value=metrics['total_records']
+            value=metrics.total_records
         )
     
     # Create tabs for different visualizations
@@ -156,54 +354,31 @@ def main():
     
     with tab1:
         st.subheader("Графики сколов в зависимости от толщины пластины по материалам")
-        chipping_fig = create_chipping_plot(
-            data,
-            selected_materials,
-            selected_cut_types,
-            thickness_range[0],
-            thickness_range[1],
-            kerf_width_range[0],
-            kerf_width_range[1]
-        )
+        chipping_fig = _get_figure("chipping", create_chipping_plot, filtered_data, data_key, filter_key)
         st.plotly_chart(chipping_fig, use_container_width=True)
     
     with tab2:
         st.subheader("Графики производительности и срока службы дисков в зависимости от толщины пластины по материалам")
-        performance_fig = create_performance_plot(
-            data,
-            selected_materials,
-            selected_cut_types,
-            thickness_range[0],
-            thickness_range[1],
-            kerf_width_range[0],
-            kerf_width_range[1]
-        )
+        performance_fig = _get_figure("performance", create_performance_plot, filtered_data, data_key, filter_key)
         st.plotly_chart(performance_fig, use_container_width=True)
     
     with tab3:
         st.subheader("Графики параметров процесса в зависимости от толщины пластины по материалам")
-        process_fig = create_process_parameters_plot(
-            data,
-            selected_materials,
-            selected_cut_types,
-            thickness_range[0],
-            thickness_range[1],
-            kerf_width_range[0],
-            kerf_width_range[1]
-        )
+        process_fig = _get_figure("process", create_process_parameters_plot, filtered_data, data_key, filter_key)
         st.plotly_chart(process_fig, use_container_width=True)
     
     with tab4:
         st.subheader("Таблица данных за выбранный период")
         if not filtered_data.empty:
-            # Show the filtered data
-            st.dataframe(filtered_data, use_container_width=True)
+            # Show the filtered data (capped to keep the browser payload small)
+            st.dataframe(filtered_data.head(MAX_DISPLAY_ROWS), use_container_width=True)
+            if len(filtered_data) > MAX_DISPLAY_ROWS:
+                st.caption(f"Показаны первые {MAX_DISPLAY_ROWS} из {len(filtered_data)} записей")
             
             # Download button for filtered data
-            csv = filtered_data.to_csv(index=False)
             st.download_button(
                 label="Скачать данные как CSV",
-                data=csv,
+                data=_csv_bytes(filtered_data, data_key, filter_key),
                 file_name="filtered_disc_data.csv",
                 mime="text/csv"
             )
@@ -264,20 +439,17 @@ def main():
     st.subheader("Дополнительный анализ")
     
     col1, col2 = st.columns(2)
+    material_statistics, cut_type_analysis = _cached_statistics(filtered_data, data_key, filter_key)
     
     with col1:
         st.write("**Статистика по материалам**")
         if selected_materials:
-            mat_stats = get_material_statistics(filtered_data)
-            stats_df = pd.DataFrame.from_dict(mat_stats, orient='index')
-            st.dataframe(stats_df, use_container_width=True)
+            st.dataframe(material_statistics, use_container_width=True)
     
     with col2:
         st.write("**Анализ по типам резки**")
         if selected_cut_types:
-            cut_analysis = get_cut_type_analysis(filtered_data)
-            analysis_df = pd.DataFrame.from_dict(cut_analysis, orient='index')
-            st.dataframe(analysis_df, use_container_width=True)
+            st.dataframe(cut_type_analysis, use_container_width=True)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,21 @@
+import pytest
+import sys
+import os
+# Add the current directory to the path to import from disc_cutting_analyzer
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from disc_cutting_analyzer.data_loader import CACHE_DIR_ENV, get_all_data
+
+
+@pytest.fixture(scope='session', autouse=True)
+def disk_cache_dir(tmp_path_factory):
+    """Keep parsed-workbook caches written during the tests out of the user cache."""
+    cache_dir = tmp_path_factory.mktemp('disk_cache')
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv(CACHE_DIR_ENV, str(cache_dir))
+        yield cache_dir
+
+
+@pytest.fixture(scope='session')
+def all_data():
+    """Load the bundled dataset once for the whole test session."""
+    return get_all_data()
@@ -1,6 +1,109 @@
+import numpy as np
 import pandas as pd
+from pandas.api.types import is_numeric_dtype
 from typing import List, Dict, Tuple
 
+from disc_cutting_analyzer.analysis_kernels import filter_mask, topk_indices
+
+# Source column -> label of its per-group average in statistics tables
+AVERAGE_LABELS = {
+    "Толщина пластины, мкм": "Средняя толщина пластины (мкм)",
+    "Сколы лицевая сторона (медиана), мкм": "Средние сколы (лицевая сторона, мкм)",
+    "Сколы обратная сторона (медиана), мкм": "Средние сколы (обратная сторона, мкм)",
+    "Производительность, шт/час": "Средняя производительность (шт/час)",
+    "Срок службы диска, резов": "Средний срок службы диска (резов)",
+    "Скорость подачи, мм/с": "Средняя скорость подачи (мм/с)",
+    "Частота оборотов шпинделя, об/мин": "Средняя частота оборотов шпинделя (об/мин)",
+}
+
+# Source column -> field name in disc recommendation records
+RECOMMENDATION_LABELS = {
+    "Артикул диска": "Артикул",
+    "Толщина пластины, мкм": "Толщина пластины (мкм)",
+    "Производительность, шт/час": "Производительность (шт/час)",
+    "Сколы лицевая сторона (медиана), мкм": "Сколы (лицевая сторона, мкм)",
+    "Сколы обратная сторона (медиана), мкм": "Сколы (обратная сторона, мкм)",
+    "Срок службы диска, резов": "Срок службы диска (резов)",
+    "Скорость подачи, мм/с": "Скорость подачи (мм/с)",
+    "Частота оборотов шпинделя, об/мин": "Частота оборотов шпинделя (об/мин)",
+}
+
+
+def _category_codes(
+    column: pd.Series, values: List[str]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Integer codes of a column and of the selected labels.
+
+    Args:
+        column (pd.Series): Column to encode
+        values (List[str]): Selected labels
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (code per row, codes of the selected
+        labels); missing values and unknown labels never share a code
+    """
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        codes, categories = column.cat.codes.to_numpy(), column.cat.categories
+    else:
+        codes, categories = pd.factorize(column)
+
+    # Translate the few selected labels to codes once; unknown labels map
+    # to -1 and are dropped so they cannot match missing values
+    selected_codes = categories.get_indexer(list(values))
+    return codes, selected_codes[selected_codes >= 0]
+
+
+def compute_mask(
+    data: pd.DataFrame,
+    selected_materials: List[str],
+    selected_cut_types: List[str],
+    min_thickness: float,
+    max_thickness: float,
+    min_kerf_width: float,
+    max_kerf_width: float,
+    thickness_sorted: bool = False,
+) -> np.ndarray:
+    """
+    Build the boolean row mask for the user selections.
+
+    Args:
+        data (pd.DataFrame): Input DataFrame to filter
+        selected_materials (List[str]): Selected materials
+        selected_cut_types (List[str]): Selected cut types
+        min_thickness (float): Minimum thickness for filtering
+        max_thickness (float): Maximum thickness for filtering
+        min_kerf_width (float): Minimum kerf width for filtering
+        max_kerf_width (float): Maximum kerf width for filtering
+        thickness_sorted (bool): Whether the rows are in ascending thickness
+            order with missing values last, as the data loader returns them;
+            the thickness range is then found by binary search
+
+    Returns:
+        np.ndarray: Boolean mask aligned with the rows of data
+    """
+    # Work on the raw arrays to skip Series construction/alignment
+    material_codes, selected_material_codes = _category_codes(
+        data["Материал пластины"], selected_materials
+    )
+    cut_codes, selected_cut_codes = _category_codes(
+        data["Тип резки"], selected_cut_types
+    )
+
+    return filter_mask(
+        material_codes,
+        selected_material_codes,
+        cut_codes,
+        selected_cut_codes,
+        data["Толщина пластины, мкм"].to_numpy(),
+        data["Ширина реза, мкм"].to_numpy(),
+        min_thickness,
+        max_thickness,
+        min_kerf_width,
+        max_kerf_width,
+        thickness_sorted=thickness_sorted,
+    )
+
 
 def filter_data(
     data: pd.DataFrame,
@@ -10,6 +113,7 @@ def filter_data(
     max_thickness: float,
     min_kerf_width: float,
     max_kerf_width: float,
+    thickness_sorted: bool = False,
 ) -> pd.DataFrame:
     """
     Filter the data based on user selections.
@@ -22,26 +126,40 @@ def filter_data(
         max_thickness (float): Maximum thickness for filtering
         min_kerf_width (float): Minimum kerf width for filtering
         max_kerf_width (float): Maximum kerf width for filtering
+        thickness_sorted (bool): Whether the rows are in ascending thickness
+            order with missing values last, as the data loader returns them;
+            the thickness range is then found by binary search
 
     Returns:
         pd.DataFrame: Filtered DataFrame
     """
-    filtered_data = data[
-        (data["Материал пластины"].isin(selected_materials))
-        & (data["Тип резки"].isin(selected_cut_types))
-        & (data["Толщина пластины, мкм"] >= min_thickness)
-        & (data["Толщина пластины, мкм"] <= max_thickness)
-        & (data["Ширина реза, мкм"] >= min_kerf_width)
-        & (data["Ширина реза, мкм"] <= max_kerf_width)
-    ].copy()
+    mask = compute_mask(
+        data,
+        selected_materials,
+        selected_cut_types,
+        min_thickness,
+        max_thickness,
+        min_kerf_width,
+        max_kerf_width,
+        thickness_sorted=thickness_sorted,
+    )
 
-    return filtered_data
+    # Callers only read the result, so skip the defensive .copy()
+    return data[mask]
 
 
 def _convert_numeric_columns(df: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
     """
     Convert specified columns to numeric, handling non-numeric values.
 
+    Columns that already have a numeric dtype (the data loader converts them
+    at load time) are left as they are; if nothing needs converting the
+    input frame is returned without a copy.
+
+    Converted columns are downcast to float32: the measured values (μm,
+    pcs/hour, RPM) fit comfortably and the subsequent scans move half the
+    bytes of float64.
+
     Args:
         df (pd.DataFrame): Input DataFrame
         columns (List[str]): List of column names to convert
@@ -49,123 +167,98 @@ def _convert_numeric_columns(df: pd.DataFrame, columns: List[str]) -> pd.DataFra
     Returns:
         pd.DataFrame: DataFrame with converted columns
     """
+    to_convert = [
+        col for col in columns if col in df.columns and not is_numeric_dtype(df[col])
+    ]
+    if not to_convert:
+        return df
+
     df_copy = df.copy()
-    for col in columns:
-        if col in df_copy.columns:
-            df_copy[col] = pd.to_numeric(df_copy[col], errors="coerce")
+    for col in to_convert:
+        df_copy[col] = pd.to_numeric(df_copy[col], errors="coerce", downcast="float")
     return df_copy
 
 
-def _calculate_material_averages(material_data: pd.DataFrame) -> Dict[str, float]:
+def _to_float64(df: pd.DataFrame) -> pd.DataFrame:
     """
-    Calculate average statistics for a specific material.
+    Widen float32 columns to float64 holding the decimals of the source cells.
+
+    The data loader stores fractional measurements as float32. Widening them
+    directly would turn 0.7 into 0.699999988079071 in tables and records, so
+    each value is rounded to the shortest decimal that identifies its float32
+    value, i.e. the value read from the workbook. Results computed from the
+    widened columns match those of float64 input.
 
     Args:
-        material_data (pd.DataFrame): DataFrame containing data for a single material
+        df (pd.DataFrame): Input DataFrame
 
     Returns:
-        Dict[str, float]: Dictionary containing average statistics for the material
+        pd.DataFrame: DataFrame with float64 instead of float32 columns; the
+        input frame itself if it has none
     """
-    # Define column mappings for better readability
-    metric_columns = {
-        "Количество": len(material_data),
-        "Средняя толщина пластины (мкм)": "Толщина пластины, мкм",
-        "Средние сколы (лицевая сторона, мкм)": "Сколы лицевая сторона (медиана), мкм",
-        "Средние сколы (обратная сторона, мкм)": "Сколы обратная сторона (медиана), мкм",
-        "Средняя производительность (шт/час)": "Производительность, шт/час",
-        "Средний срок службы диска (резов)": "Срок службы диска, резов",
-        "Средняя скорость подачи (мм/с)": "Скорость подачи, мм/с",
-        "Средняя частота оборотов шпинделя (об/мин)": "Частота оборотов шпинделя, об/мин",
-    }
+    float32_columns = df.select_dtypes(include="float32").columns
+    if float32_columns.empty:
+        return df
 
-    averages = {"Количество": metric_columns["Количество"]}
-
-    # Calculate means for all numeric metrics
-    for metric_name, column_name in metric_columns.items():
-        if metric_name != "Количество" and column_name in material_data.columns:
-            averages[metric_name] = material_data[column_name].mean()
-
-    return averages
+    return df.astype({col: str for col in float32_columns}).astype(
+        {col: "float64" for col in float32_columns}
+    )
 
 
-def get_material_statistics(data: pd.DataFrame) -> Dict[str, Dict[str, float]]:
+def _stats_by(data: pd.DataFrame, key: str) -> pd.DataFrame:
     """
-    Calculate statistics for each material in the dataset.
+    Row count and column averages per value of a grouping column.
 
     Args:
         data (pd.DataFrame): Input DataFrame
+        key (str): Column to group by
 
     Returns:
-        Dict[str, Dict[str, float]]: Statistics for each material
+        pd.DataFrame: Statistics table indexed by the values of key
     """
     if data.empty:
-        return {}
+        return pd.DataFrame(columns=["Количество", *AVERAGE_LABELS.values()])
 
-    # Define numeric columns that need to be converted
-    numeric_columns = [
-        "Толщина пластины, мкм",
-        "Сколы лицевая сторона (медиана), мкм",
-        "Сколы обратная сторона (медиана), мкм",
-        "Производительность, шт/час",
-        "Срок службы диска, резов",
-        "Скорость подачи, мм/с",
-        "Частота оборотов шпинделя, об/мин",
-    ]
-
-    # Pre-convert all numeric columns to optimize performance
-    processed_data = _convert_numeric_columns(data, numeric_columns)
+    numeric_columns = [col for col in AVERAGE_LABELS if col in data.columns]
 
-    # Get unique materials
-    unique_materials = processed_data["Материал пластины"].dropna().unique()
+    # Pre-convert all numeric columns to optimize performance; averages are
+    # taken on float64 values so float32 rounding noise does not show
+    processed_data = _to_float64(
+        _convert_numeric_columns(data[[key, *numeric_columns]], numeric_columns)
+    )
 
-    # Calculate statistics for each material
-    material_stats = {}
-    for material in unique_materials:
-        material_subset = processed_data[
-            processed_data["Материал пластины"] == material
-        ]
-        material_stats[material] = _calculate_material_averages(material_subset)
+    # One hashed groupby pass instead of a boolean mask per group
+    grouped = processed_data.groupby(key, sort=False, observed=True)
+    stats = grouped[numeric_columns].mean().rename(columns=AVERAGE_LABELS)
+    stats.insert(0, "Количество", grouped.size())
 
-    return material_stats
+    return stats
 
 
-def get_cut_type_analysis(data: pd.DataFrame) -> Dict[str, Dict[str, float]]:
+def get_material_statistics(data: pd.DataFrame) -> pd.DataFrame:
     """
-    Analyze data by cut type.
+    Calculate statistics for each material in the dataset.
 
     Args:
         data (pd.DataFrame): Input DataFrame
 
     Returns:
-        Dict[str, Dict[str, float]]: Analysis for each cut type
+        pd.DataFrame: Statistics table indexed by material
     """
-    if data.empty:
-        return {}
+    return _stats_by(data, "Материал пластины")
 
-    # Define numeric columns that need to be converted
-    numeric_columns = [
-        "Толщина пластины, мкм",
-        "Сколы лицевая сторона (медиана), мкм",
-        "Сколы обратная сторона (медиана), мкм",
-        "Производительность, шт/час",
-        "Срок службы диска, резов",
-        "Скорость подачи, мм/с",
-        "Частота оборотов шпинделя, об/мин",
-    ]
 
-    # Pre-convert all numeric columns to optimize performance
-    processed_data = _convert_numeric_columns(data, numeric_columns)
-
-    # Get unique cut types
-    unique_cut_types = processed_data["Тип резки"].dropna().unique()
+def get_cut_type_analysis(data: pd.DataFrame) -> pd.DataFrame:
+    """
+    Analyze data by cut type.
 
-    # Calculate statistics for each cut type
-    cut_type_stats = {}
-    for cut_type in unique_cut_types:
-        cut_type_subset = processed_data[processed_data["Тип резки"] == cut_type]
-        cut_type_stats[cut_type] = _calculate_material_averages(cut_type_subset)
+    Args:
+        data (pd.DataFrame): Input DataFrame
 
-    return cut_type_stats
+    Returns:
+        pd.DataFrame: Statistics table indexed by cut type
+    """
+    return _stats_by(data, "Тип резки")
 
 
 def get_thickness_ranges(data: pd.DataFrame) -> List[Tuple[float, float]]:
@@ -178,25 +271,17 @@ def get_thickness_ranges(data: pd.DataFrame) -> List[Tuple[float, float]]:
     Returns:
         List[Tuple[float, float]]: List of (min, max) thickness ranges
     """
-    thickness_values = sorted(data["Толщина пластины, мкм"].unique())
-
-    if len(thickness_values) < 2:
-        return [(thickness_values[0], thickness_values[0])] if thickness_values else []
-
-    # Group thickness values into ranges
-    ranges = []
-    start = thickness_values[0]
-    prev = thickness_values[0]
+    thickness = _to_float64(data[["Толщина пластины, мкм"]])["Толщина пластины, мкм"]
+    thickness_values = np.sort(pd.unique(thickness.dropna()))
 
-    for val in thickness_values[1:]:
-        if val - prev > 50:  # If gap is larger than 50 μm, start a new range
-            ranges.append((start, prev))
-            start = val
-        prev = val
+    if thickness_values.size == 0:
+        return []
 
-    ranges.append((start, prev))
+    # Split the sorted values wherever the gap is larger than 50 μm
+    splits = np.flatnonzero(np.diff(thickness_values) > 50) + 1
+    segments = np.split(thickness_values, splits)
 
-    return ranges
+    return [(segment[0], segment[-1]) for segment in segments]
 
 
 def find_optimal_settings(
@@ -214,22 +299,27 @@ def find_optimal_settings(
     Returns:
         pd.DataFrame: Optimal settings sorted by performance
     """
-    material_data = data[data["Материал пластины"] == material].copy()
+    material_data = data[data["Материал пластины"] == material]
 
     if cut_type:
         material_data = material_data[material_data["Тип резки"] == cut_type]
 
-    # Calculate distance to target thickness
-    material_data["thickness_distance"] = abs(
-        material_data["Толщина пластины, мкм"] - target_thickness
+    # Rank on raw float arrays instead of sorting the whole frame
+    values = material_data[
+        ["Толщина пластины, мкм", "Производительность, шт/час"]
+    ].to_numpy(dtype=np.float64)
+    top = topk_indices(values[:, 0], values[:, 1], target_thickness, 10)
+
+    # Report the source values rather than their float32 approximations;
+    # whole-number thickness keeps whole-number distances
+    optimal_data = _to_float64(material_data.iloc[top])
+    thickness = optimal_data["Толщина пластины, мкм"]
+    thickness = thickness.astype(np.result_type(thickness.dtype, np.int64))
+    optimal_data = optimal_data.assign(
+        thickness_distance=(thickness - target_thickness).abs()
     )
 
-    # Sort by thickness proximity and performance
-    optimal_data = material_data.sort_values(
-        ["thickness_distance", "Производительность, шт/час"], ascending=[True, False]
-    )
-
-    return optimal_data.head(10)  # Return top 10 closest matches
+    return optimal_data  # Top 10 closest matches
 
 
 def get_disc_recommendations(
@@ -247,51 +337,30 @@ def get_disc_recommendations(
     Returns:
         List[Dict[str, any]]: List of recommended disc settings
     """
-    material_data = data[data["Материал пластины"] == material].copy()
+    material_data = data[data["Материал пластины"] == material]
 
     if cut_type:
         material_data = material_data[material_data["Тип резки"] == cut_type]
 
-    # Calculate distance to target thickness
-    material_data["thickness_distance"] = abs(
-        material_data["Толщина пластины, мкм"] - thickness
-    )
-
-    # Sort by thickness proximity and performance
-    recommendations = material_data.sort_values(
+    columns = material_data[
         [
-            "thickness_distance",
+            "Толщина пластины, мкм",
             "Производительность, шт/час",
             "Сколы лицевая сторона (медиана), мкм",
-        ],
-        ascending=[True, False, True],
-    )
+        ]
+    ].to_numpy(dtype=np.float64)
 
-    # Take top 5 recommendations
-    top_recommendations = recommendations.head(5)
-
-    result = []
-    for _, row in top_recommendations.iterrows():
-        result.append(
-            {
-                "Артикул": row["Артикул диска"],
-                "Толщина пластины (мкм)": row["Толщина пластины, мкм"],
-                "Производительность (шт/час)": row["Производительность, шт/час"],
-                "Сколы (лицевая сторона, мкм)": row[
-                    "Сколы лицевая сторона (медиана), мкм"
-                ],
-                "Сколы (обратная сторона, мкм)": row[
-                    "Сколы обратная сторона (медиана), мкм"
-                ],
-                "Срок службы диска (резов)": row["Срок службы диска, резов"],
-                "Скорость подачи (мм/с)": row["Скорость подачи, мм/с"],
-                "Частота оборотов шпинделя (об/мин)": row[
-                    "Частота оборотов шпинделя, об/мин"
-                ],
-            }
-        )
+    # Closest thickness first, then higher performance, then lower chipping
+    top = topk_indices(
+        columns[:, 0], columns[:, 1], thickness, 5, chipping=columns[:, 2]
+    )
+    top_recommendations = material_data.iloc[top]
 
-    return result
+    return (
+        _to_float64(top_recommendations[list(RECOMMENDATION_LABELS)])
+        .rename(columns=RECOMMENDATION_LABELS)
+        .to_dict(orient="records")
+    )
 
 
 def compare_materials(data: pd.DataFrame, materials: List[str]) -> pd.DataFrame:
@@ -305,59 +374,45 @@ def compare_materials(data: pd.DataFrame, materials: List[str]) -> pd.DataFrame:
     Returns:
         pd.DataFrame: Comparison table
     """
-    comparison_data = []
-
-    for material in materials:
-        mat_data = data[data["Материал пластины"] == material]
-
-        if not mat_data.empty:
-            # Convert relevant columns to numeric, handling non-numeric values
-            numeric_cols = [
-                "Толщина пластины, мкм",
-                "Сколы лицевая сторона (медиана), мкм",
-                "Сколы обратная сторона (медиана), мкм",
-                "Производительность, шт/час",
-                "Срок службы диска, резов",
-            ]
+    numeric_cols = [
+        "Толщина пластины, мкм",
+        "Сколы лицевая сторона (медиана), мкм",
+        "Сколы обратная сторона (медиана), мкм",
+        "Производительность, шт/час",
+        "Срок службы диска, резов",
+    ]
 
-            for col in numeric_cols:
-                if col in mat_data.columns:
-                    mat_data = mat_data.copy()  # Explicitly work on a copy
-                    mat_data[col] = pd.to_numeric(mat_data[col], errors="coerce")
-
-            comparison_data.append(
-                {
-                    "Материал": material,
-                    "Количество": len(mat_data),
-                    "Средняя толщина пластины (мкм)": mat_data[
-                        "Толщина пластины, мкм"
-                    ].mean(),
-                    "Средние сколы (лицевая сторона, мкм)": mat_data[
-                        "Сколы лицевая сторона (медиана), мкм"
-                    ].mean(),
-                    "Средние сколы (обратная сторона, мкм)": mat_data[
-                        "Сколы обратная сторона (медиана), мкм"
-                    ].mean(),
-                    "Средняя производительность (шт/час)": mat_data[
-                        "Производительность, шт/час"
-                    ].mean(),
-                    "Средний срок службы диска (резов)": mat_data[
-                        "Срок службы диска, резов"
-                    ].mean(),
-                    "Минимальные сколы (лицевая сторона, мкм)": mat_data[
-                        "Сколы лицевая сторона (медиана), мкм"
-                    ].min(),
-                    "Максимальные сколы (лицевая сторона, мкм)": mat_data[
-                        "Сколы лицевая сторона (медиана), мкм"
-                    ].max(),
-                    "Лучшая производительность (шт/час)": mat_data[
-                        "Производительность, шт/час"
-                    ].max(),
-                }
-            )
-
-    comparison_df = pd.DataFrame(comparison_data)
-    return comparison_df
+    # Convert relevant columns to numeric once, handling non-numeric values
+    mat_data = _to_float64(
+        _convert_numeric_columns(
+            data[data["Материал пластины"].isin(materials)], numeric_cols
+        )
+    )
+
+    # Single groupby reduction for all materials and metrics; the averages
+    # share their labels with the statistics tables
+    aggregations = {
+        "Количество": ("Толщина пластины, мкм", "size"),
+        **{AVERAGE_LABELS[col]: (col, "mean") for col in numeric_cols},
+        "Минимальные сколы (лицевая сторона, мкм)": (
+            "Сколы лицевая сторона (медиана), мкм",
+            "min",
+        ),
+        "Максимальные сколы (лицевая сторона, мкм)": (
+            "Сколы лицевая сторона (медиана), мкм",
+            "max",
+        ),
+        "Лучшая производительность (шт/час)": ("Производительность, шт/час", "max"),
+    }
+    comparison_df = mat_data.groupby(
+        "Материал пластины", sort=False, observed=True
+    ).agg(**aggregations)
+
+    # Keep the requested material order and skip materials without data
+    comparison_df = comparison_df.reindex(
+        [m for m in materials if m in comparison_df.index]
+    )
+    return comparison_df.rename_axis("Материал").reset_index()
 
 
 def get_performance_trends(data: pd.DataFrame) -> Dict[str, List[Tuple]]:
@@ -374,33 +429,37 @@ def get_performance_trends(data: pd.DataFrame) -> Dict[str, List[Tuple]]:
 
     # Thickness vs Performance trend
     if not data.empty:
-        # Convert relevant columns to numeric
-        data_for_trends = data.copy()
-        data_for_trends["Толщина пластины, мкм"] = pd.to_numeric(
-            data_for_trends["Толщина пластины, мкм"], errors="coerce"
-        )
-        data_for_trends["Производительность, шт/час"] = pd.to_numeric(
-            data_for_trends["Производительность, шт/час"], errors="coerce"
+        thickness_col = "Толщина пластины, мкм"
+        performance_col = "Производительность, шт/час"
+
+        # Convert relevant columns to numeric (no-op for cleaned data) and
+        # keep only the four columns the trends need
+        data_for_trends = _to_float64(
+            _convert_numeric_columns(data, [thickness_col, performance_col])[
+                [thickness_col, performance_col, "Материал пластины", "Тип резки"]
+            ]
         )
 
         # Drop rows with NaN values for grouping
-        clean_data = data_for_trends.dropna(
-            subset=["Толщина пластины, мкм", "Производительность, шт/час"]
-        )
+        clean_data = data_for_trends.dropna(subset=[thickness_col, performance_col])
+
+        # All three trends group the same performance Series by a different key
+        performance = clean_data[performance_col]
 
-        thickness_perf = clean_data.groupby("Толщина пластины, мкм")[
-            "Производительность, шт/час"
-        ].mean()
+        # Thickness is a trend axis, so keep it sorted
+        thickness_perf = performance.groupby(clean_data[thickness_col]).mean()
         trends["thickness_vs_performance"] = list(thickness_perf.items())
 
-        # Material vs Average Performance
-        material_perf = clean_data.groupby("Материал пластины")[
-            "Производительность, шт/час"
-        ].mean()
+        # Material vs Average Performance; categorical codes, no final sort
+        material_perf = performance.groupby(
+            clean_data["Материал пластины"], sort=False, observed=True
+        ).mean()
         trends["material_vs_performance"] = list(material_perf.items())
 
         # Cut Type vs Average Performance
-        cut_perf = clean_data.groupby("Тип резки")["Производительность, шт/час"].mean()
+        cut_perf = performance.groupby(
+            clean_data["Тип резки"], sort=False, observed=True
+        ).mean()
         trends["cut_type_vs_performance"] = list(cut_perf.items())
 
     return trends
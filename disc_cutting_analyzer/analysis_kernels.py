@@ -0,0 +1,179 @@
+import numpy as np
+from typing import Tuple
+
+
+def _codes_in(codes: np.ndarray, selected_codes: np.ndarray) -> np.ndarray:
+    """
+    Membership of integer codes in a small set of selected codes.
+
+    ORs one equality mask per selected code. For the handful of categories a
+    user selects this is far cheaper than np.isin, which builds a lookup
+    table or sorts on every call.
+
+    Args:
+        codes (np.ndarray): Integer code per row
+        selected_codes (np.ndarray): Selected codes
+
+    Returns:
+        np.ndarray: Boolean mask, True where the code is selected
+    """
+    # Compare in the codes' own (small) dtype rather than upcasting every row
+    selected_codes = np.asarray(selected_codes).astype(codes.dtype, copy=False)
+    if selected_codes.size == 1:
+        # Single selection (the common case): one comparison, no accumulator
+        return codes == selected_codes[0]
+
+    mask = np.zeros(codes.shape, dtype=bool)
+    for code in selected_codes:
+        mask |= codes == code
+    return mask
+
+
+def filter_mask(
+    material_codes: np.ndarray,
+    selected_material_codes: np.ndarray,
+    cut_codes: np.ndarray,
+    selected_cut_codes: np.ndarray,
+    thickness: np.ndarray,
+    kerf_width: np.ndarray,
+    min_thickness: float,
+    max_thickness: float,
+    min_kerf_width: float,
+    max_kerf_width: float,
+    thickness_sorted: bool = False,
+) -> np.ndarray:
+    """
+    Boolean row mask for the user selections on plain arrays.
+
+    Materials and cut types are given as integer codes, so membership is a
+    few integer comparisons rather than string hashing. If the rows are sorted
+    by thickness, the thickness range is found with a binary search and the
+    other conditions are only evaluated inside it.
+
+    Args:
+        material_codes (np.ndarray): Material code per row
+        selected_material_codes (np.ndarray): Codes of the selected materials
+        cut_codes (np.ndarray): Cut type code per row
+        selected_cut_codes (np.ndarray): Codes of the selected cut types
+        thickness (np.ndarray): Wafer thickness per row
+        kerf_width (np.ndarray): Kerf width per row
+        min_thickness (float): Minimum thickness
+        max_thickness (float): Maximum thickness
+        min_kerf_width (float): Minimum kerf width
+        max_kerf_width (float): Maximum kerf width
+        thickness_sorted (bool): Whether thickness is ascending with NaN last
+
+    Returns:
+        np.ndarray: Boolean mask, True for rows matching every condition
+    """
+    if thickness_sorted:
+        start = np.searchsorted(thickness, min_thickness, side="left")
+        stop = max(start, np.searchsorted(thickness, max_thickness, side="right"))
+        rows = slice(start, stop)
+        in_range = _codes_in(material_codes[rows], selected_material_codes)
+        in_range &= _codes_in(cut_codes[rows], selected_cut_codes)
+        in_range &= kerf_width[rows] >= min_kerf_width
+        in_range &= kerf_width[rows] <= max_kerf_width
+        mask = np.zeros(thickness.shape[0], dtype=bool)
+        mask[rows] = in_range
+        return mask
+
+    mask = _codes_in(material_codes, selected_material_codes)
+    # Accumulate in place to avoid a temporary per condition
+    mask &= _codes_in(cut_codes, selected_cut_codes)
+    mask &= thickness >= min_thickness
+    mask &= thickness <= max_thickness
+    mask &= kerf_width >= min_kerf_width
+    mask &= kerf_width <= max_kerf_width
+    return mask
+
+
+def topk_indices(
+    thickness: np.ndarray,
+    performance: np.ndarray,
+    target: float,
+    k: int,
+    chipping: np.ndarray = None,
+) -> np.ndarray:
+    """
+    Positions of the k rows closest to the target thickness.
+
+    Rows are ranked by absolute thickness distance (ascending), ties are
+    broken by performance (descending) and, if given, chipping (ascending).
+    Rows that tie on every key keep their original order, matching a stable
+    pandas sort_values. Only the shortlist of rows within the k-th smallest
+    distance is sorted.
+
+    Args:
+        thickness (np.ndarray): Wafer thickness per row
+        performance (np.ndarray): Performance per row
+        target (float): Target thickness
+        k (int): Number of rows to return
+        chipping (np.ndarray, optional): Front chipping per row, used as the
+            last tie-breaker
+
+    Returns:
+        np.ndarray: Row positions of the top-k matches, best first
+    """
+    distance = np.abs(thickness - target)
+    n = distance.shape[0]
+
+    candidates = np.arange(n)
+    if k < n:
+        kth = np.partition(distance, k - 1)[k - 1]
+        # A NaN cut-off means fewer than k valid distances: keep every row
+        if not np.isnan(kth):
+            candidates = np.flatnonzero(distance <= kth)
+
+    # np.lexsort treats the last key as primary and is stable
+    keys = (-performance[candidates], distance[candidates])
+    if chipping is not None:
+        keys = (chipping[candidates],) + keys
+    order = np.lexsort(keys)
+    return candidates[order][:k]
+
+
+def linear_fit(x: np.ndarray, y: np.ndarray) -> Tuple[float, float]:
+    """
+    Least-squares straight line through the points, in closed form.
+
+    Equivalent to np.polyfit(x, y, 1) without building a Vandermonde
+    matrix and running an SVD. Sums are taken in float64.
+
+    Args:
+        x (np.ndarray): X values (no NaN)
+        y (np.ndarray): Y values (no NaN)
+
+    Returns:
+        Tuple[float, float]: (slope, intercept)
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    x_mean = x.mean()
+    y_mean = y.mean()
+    dx = x - x_mean
+    denominator = np.dot(dx, dx)
+    if denominator == 0:
+        # All points share one x: a flat line through the mean, as polyfit gives
+        return 0.0, float(y_mean)
+    slope = np.dot(dx, y - y_mean) / denominator
+    return float(slope), float(y_mean - slope * x_mean)
+
+
+def nan_column_means(values: np.ndarray) -> np.ndarray:
+    """
+    Mean of every column of a 2D array, skipping NaN, in one pass.
+
+    Columns without any value average to 0 rather than NaN, and no
+    'Mean of empty slice' warning is raised as with np.nanmean.
+
+    Args:
+        values (np.ndarray): 2D array, one column per metric
+
+    Returns:
+        np.ndarray: Mean per column (float64)
+    """
+    valid = ~np.isnan(values)
+    counts = valid.sum(axis=0)
+    sums = np.where(valid, values, 0).sum(axis=0, dtype=np.float64)
+    return np.divide(sums, counts, out=np.zeros_like(sums), where=counts > 0)
@@ -0,0 +1,16 @@
+# Column groups of the cutting database, shared by the loader and the analysis code
+
+# Columns holding measured values; coerced to float32 when a workbook is loaded
+NUMERIC_COLUMNS = [
+    "Толщина пластины, мкм",
+    "Ширина реза, мкм",
+    "Частота оборотов шпинделя, об/мин",
+    "Скорость подачи, мм/с",
+    "Сколы лицевая сторона (медиана), мкм",
+    "Сколы обратная сторона (медиана), мкм",
+    "Производительность, шт/час",
+    "Срок службы диска, резов",
+]
+
+# Low-cardinality text columns stored as pandas categoricals
+CATEGORICAL_COLUMNS = ["Материал пластины", "Тип резки", "Артикул диска"]
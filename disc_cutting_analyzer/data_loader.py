@@ -1,7 +1,84 @@
+import numpy as np
 import pandas as pd
+from pandas.api.types import is_integer_dtype
 import streamlit as st
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+import hashlib
 import os
+import tempfile
+
+from disc_cutting_analyzer.columns import CATEGORICAL_COLUMNS, NUMERIC_COLUMNS
+
+# Bump when the loader changes the shape or dtypes of the combined frame,
+# so stale on-disk caches are not picked up
+DISK_CACHE_VERSION = 6
+
+# Directory for the parsed-workbook caches; defaults to the user cache directory
+CACHE_DIR_ENV = "DISC_ANALYZER_CACHE_DIR"
+
+
+def _convert_categorical_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convert low-cardinality text columns to categorical dtype in place.
+    
+    Filters (.isin, ==) and groupby on these columns then work on integer
+    codes instead of hashing Python strings row by row.
+    
+    Args:
+        df (pd.DataFrame): Combined DataFrame
+        
+    Returns:
+        pd.DataFrame: The same DataFrame with converted columns
+    """
+    for col in CATEGORICAL_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype("category")
+    return df
+
+
+def _coerce_numeric_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convert measured-value columns to numbers and downcast them in place.
+    
+    Non-numeric cells become NaN. Columns holding fractional values or gaps
+    are stored as float32; whole-number columns (thickness, kerf width, RPM)
+    keep an integer type, so they are shown and exported as 50 rather than
+    50.0. Doing this once at load time lets the analysis and plotting code
+    work on typed columns without converting them again on every interaction.
+    
+    Args:
+        df (pd.DataFrame): Combined DataFrame
+        
+    Returns:
+        pd.DataFrame: The same DataFrame with converted columns
+    """
+    for col in NUMERIC_COLUMNS:
+        if col in df.columns:
+            values = pd.to_numeric(df[col], errors="coerce")
+            df[col] = values if is_integer_dtype(values) else values.astype("float32")
+    
+    # Whole-number columns (measured values and e.g. row numbers) get the smallest integer type
+    for col in df.select_dtypes(include="integer").columns:
+        df[col] = pd.to_numeric(df[col], downcast="integer")
+    return df
+
+
+def _sort_by_thickness(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Order rows by wafer thickness (stable, missing thickness last).
+    
+    The loaders return rows in this order so the app can filter the
+    thickness range with a binary search (filter_data(..., thickness_sorted=True)).
+    
+    Args:
+        df (pd.DataFrame): Combined DataFrame
+        
+    Returns:
+        pd.DataFrame: Sorted DataFrame with a fresh RangeIndex
+    """
+    return df.sort_values(
+        'Толщина пластины, мкм', kind='stable', na_position='last', ignore_index=True
+    )
 
 
 @st.cache_data
@@ -16,15 +93,12 @@ def load_data(file_path: str) -> Dict[str, pd.DataFrame]:
         Dict[str, pd.DataFrame]: Dictionary with sheet names as keys and DataFrames as values
     """
     try:
-        # Read all sheets from the Excel file
-        excel_file = pd.ExcelFile(file_path)
-        data_dict = {}
+        # Read all sheets from the Excel file in a single parse
+        data_dict = pd.read_excel(file_path, sheet_name=None, engine="openpyxl")
         
-        for sheet_name in excel_file.sheet_names:
-            df = pd.read_excel(file_path, sheet_name=sheet_name)
+        for df in data_dict.values():
             # Clean column names to handle any special characters
             df.columns = df.columns.str.strip()
-            data_dict[sheet_name] = df
             
         return data_dict
     except Exception as e:
@@ -32,33 +106,151 @@ def load_data(file_path: str) -> Dict[str, pd.DataFrame]:
         return {}
 
 
-def get_all_data() -> pd.DataFrame:
+def _combine_sheets(sheets: Dict[str, pd.DataFrame]) -> pd.DataFrame:
     """
-    Get all data combined from all sheets in the Excel file.
+    Stack per-sheet DataFrames into one typed frame with a 'Material' column.
     
+    The sheets are concatenated as they are (no per-sheet copies) and the
+    source sheet is recorded as a categorical built from the row counts, so
+    the sheet name is not repeated as a string on every row. Rows come back
+    in thickness order (see _sort_by_thickness).
+    
+    Args:
+        sheets (Dict[str, pd.DataFrame]): Sheet name -> DataFrame
+        
     Returns:
-        pd.DataFrame: Combined DataFrame with all data and a 'Material' column indicating the source
+        pd.DataFrame: Combined DataFrame
     """
-    # Define the path to the Excel file
-    file_path = os.path.join(os.path.dirname(__file__), "..", "DevelopNEW data", "База данных. Диски ADT пополнение.xlsx")
+    sheet_names = list(sheets)
+    combined_df = pd.concat(sheets.values(), ignore_index=True)
+    
+    # Add material column to identify source
+    sheet_codes = np.repeat(np.arange(len(sheet_names)), [len(df) for df in sheets.values()])
+    combined_df['Material'] = pd.Categorical.from_codes(sheet_codes, categories=sheet_names)
+    
+    _coerce_numeric_columns(combined_df)
+    return _sort_by_thickness(_convert_categorical_columns(combined_df))
+
+
+def _disk_cache_path(source_path: str) -> str:
+    """
+    Build the cache file path for a workbook.
+    
+    Caches live outside the data directory, in $DISC_ANALYZER_CACHE_DIR or
+    the user cache directory. The name carries a hash of the absolute source
+    path, so workbooks with the same name do not collide, and
+    DISK_CACHE_VERSION, so caches of an older loader are never read.
+    
+    Args:
+        source_path (str): Path of the workbook
+        
+    Returns:
+        str: Path of the pickled DataFrame
+    """
+    cache_dir = os.environ.get(CACHE_DIR_ENV) or os.path.join(
+        os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+        "disc_cutting_analyzer"
+    )
+    source_path = os.path.abspath(source_path)
+    stem = os.path.splitext(os.path.basename(source_path))[0]
+    source_hash = hashlib.sha1(source_path.encode("utf-8")).hexdigest()[:12]
+    return os.path.join(cache_dir, f"{stem}-{source_hash}.v{DISK_CACHE_VERSION}.pkl")
+
+
+def _read_disk_cache(cache_path: str, source_path: str) -> Optional[pd.DataFrame]:
+    """
+    Read a previously parsed frame if it is at least as new as its source.
+    
+    Args:
+        cache_path (str): Path of the pickled DataFrame
+        source_path (str): Path of the file the cache was built from
+        
+    Returns:
+        Optional[pd.DataFrame]: Cached DataFrame, or None if missing or stale
+    """
+    try:
+        if os.path.getmtime(cache_path) < os.path.getmtime(source_path):
+            return None
+        return pd.read_pickle(cache_path)
+    except Exception:
+        # Missing, unreadable or written by an incompatible pandas: re-parse
+        return None
+
+
+def _write_disk_cache(df: pd.DataFrame, cache_path: str) -> None:
+    """
+    Store a parsed frame for warm restarts; failures are ignored.
+    
+    The frame is written to a temporary file that replaces the cache in one
+    step, so a concurrent reader never sees a half-written pickle.
+    
+    Args:
+        df (pd.DataFrame): Parsed DataFrame
+        cache_path (str): Path of the pickled DataFrame
+    """
+    temp_path = None
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(cache_path), suffix=".tmp")
+        with os.fdopen(fd, "wb") as temp_file:
+            df.to_pickle(temp_file)
+        os.replace(temp_path, cache_path)
+        temp_path = None
+    except Exception:
+        # Read-only deployments or unpicklable frames simply parse the
+        # workbook on every cold start
+        pass
+    finally:
+        # Do not leave a partial pickle behind when the replace did not happen
+        if temp_path is not None:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+
+
+def _load_workbook(file_path: str) -> pd.DataFrame:
+    """
+    Load and combine all sheets of a workbook, reusing the on-disk cache.
+    
+    Args:
+        file_path (str): Path to the Excel file
+        
+    Returns:
+        pd.DataFrame: Combined DataFrame (see _combine_sheets), empty if the file cannot be read
+    """
+    cache_path = _disk_cache_path(file_path)
+    
+    # Reuse the typed frame from a previous run unless the workbook changed
+    cached_df = _read_disk_cache(cache_path, file_path)
+    if cached_df is not None:
+        return cached_df
     
     # Load data from all sheets
     data_dict = load_data(file_path)
     
     # Combine all sheets into a single DataFrame
-    all_data_list = []
-    for sheet_name, df in data_dict.items():
-        df_copy = df.copy()
-        df_copy['Material'] = sheet_name  # Add material column to identify source
-        all_data_list.append(df_copy)
-    
-    if all_data_list:
-        combined_df = pd.concat(all_data_list, ignore_index=True)
+    if data_dict:
+        combined_df = _combine_sheets(data_dict)
+        _write_disk_cache(combined_df, cache_path)
         return combined_df
     else:
         return pd.DataFrame()
 
 
+def get_all_data() -> pd.DataFrame:
+    """
+    Get all data combined from all sheets in the Excel file.
+    
+    Returns:
+        pd.DataFrame: Combined DataFrame with all data and a 'Material' column indicating the source,
+        rows ordered by wafer thickness
+    """
+    # Define the path to the Excel file
+    file_path = os.path.join(os.path.dirname(__file__), "..", "DevelopNEW data", "База данных. Диски ADT пополнение.xlsx")
+    return _load_workbook(file_path)
+
+
 @st.cache_data
 def load_uploaded_data(uploaded_file) -> pd.DataFrame:
     """
@@ -68,28 +260,19 @@ def load_uploaded_data(uploaded_file) -> pd.DataFrame:
         uploaded_file: Uploaded file object from Streamlit's file_uploader
         
     Returns:
-        pd.DataFrame: Combined data from all sheets in the uploaded file
+        pd.DataFrame: Combined data from all sheets in the uploaded file, rows ordered by wafer thickness
     """
     try:
-        # Read all sheets from the uploaded Excel file
-        excel_file = pd.ExcelFile(uploaded_file)
-        sheet_names = excel_file.sheet_names
-        
-        all_dataframes = []
+        # Read all sheets from the uploaded Excel file in a single parse
+        sheets = pd.read_excel(uploaded_file, sheet_name=None, engine="openpyxl")
         
-        for sheet_name in sheet_names:
-            # Read each sheet from the uploaded file
-            df = pd.read_excel(uploaded_file, sheet_name=sheet_name)
+        for df in sheets.values():
             # Clean column names to handle any special characters
             df.columns = df.columns.str.strip()
-            # Add a column to identify the material based on sheet name
-            df['Material'] = sheet_name
-            all_dataframes.append(df)
         
         # Combine all dataframes
-        if all_dataframes:
-            combined_data = pd.concat(all_dataframes, ignore_index=True)
-            return combined_data
+        if sheets:
+            return _combine_sheets(sheets)
         else:
             st.error("Не удалось загрузить данные из файла. Проверьте формат файла.")
             return pd.DataFrame()
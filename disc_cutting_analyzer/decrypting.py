@@ -1,34 +1,71 @@
 import pandas as pd
 import streamlit as st
+from functools import lru_cache
 from typing import Dict, Optional
 import os
+import re
 
 
 # Remove the Excel loading function as we're using CSV directly
 
+# Notation table mapping article codes to disc parameters
+PARAMETERS_PATH = os.path.join(os.path.dirname(__file__), "..", "DevelopNEW data", "Условные обозначения.csv")
 
-def decode_article(article: str) -> Optional[Dict[str, str]]:
+# Article layout 00757-GCTT-EEE-HXX; groups: G, C, TT, EEE, H
+ARTICLE_PATTERN = re.compile(r'00757-([^-])([^-])([^-]{2})-([^-]{3})-([^-])[^-]{2}')
+
+# Decoded field -> parameter name in the notation table, in pattern group order
+ARTICLE_FIELDS = {
+    'grit_size': 'Grit Size (Размер алмазного зерна)',
+    'diamond_percent': 'Diamond % (Концентрация алмазного зерна)',
+    'blade_thickness': 'Blade thickness (Толщина лезвия)',
+    'blade_exposure': 'Blade exposure (Вылет лезвия)',
+    'bond_hardness': 'Bond hardness (Твёрдость связки)'
+}
+
+# Product family shared by every article with the 00757 prefix
+PRODUCT_FAMILY = 'Hub blade (фланцевый/корпусной диск)'
+
+
+@lru_cache(maxsize=1)
+def load_parameter_lookup() -> Dict[str, Dict[str, str]]:
     """
-    Decode a disc article to extract its parameters based on the naming convention.
+    Load the article notation table once as nested dictionaries.
+    
+    Returns:
+        Dict[str, Dict[str, str]]: Parameter name -> {article code: value}
+    """
+    params_df = pd.read_csv(PARAMETERS_PATH, sep=';', encoding='utf-8-sig')  # Use utf-8-sig to handle BOM
+    
+    # Using positional column indices due to encoding issues with Cyrillic column names
+    # Column 0: Параметр, Column 1: Условное обозначение в артикуле, Column 2: Значение, Column 3: Единица измерения
+    lookup = {}
+    for param, code, value in params_df.iloc[:, :3].itertuples(index=False):
+        # Keep the first row for a code, as the row-scanning lookup did
+        lookup.setdefault(param, {}).setdefault(code, str(value))
+    return lookup
+
+
+@lru_cache(maxsize=4096)
+def _decode_article_cached(article: str) -> Dict[str, str]:
+    """
+    Decode an article against the loaded parameter table (memoized).
+    
+    The returned dictionary is shared between calls and must not be modified;
+    decode_article returns copies of it.
     
     Args:
-        article (str): The disc article string (e.g., "00757-1130-250-100")
+        article (str): The disc article string
         
     Returns:
-        Optional[Dict[str, str]]: Decoded parameters or None if invalid
+        Dict[str, str]: Decoded parameters, empty strings for unknown parts
     """
-    # Load the parameter mapping from the CSV file
-    file_path = os.path.join(os.path.dirname(__file__), "..", "DevelopNEW data", "Условные обозначения.csv")
-    try:
-        params_df = pd.read_csv(file_path, sep=';', encoding='utf-8-sig')  # Use utf-8-sig to handle BOM
-    except Exception as e:
-        st.error(f"Error loading disc parameters from CSV: {str(e)}")
-        return None
+    lookup = load_parameter_lookup()
     
     # Initialize result dictionary
     decoded_params = {
         'article': article,
-        'product_family': 'Hub blade (фланцевый/корпусной диск)',
+        'product_family': PRODUCT_FAMILY,
         'grit_size': '',
         'diamond_percent': '',
         'blade_thickness': '',
@@ -38,58 +75,75 @@ def decode_article(article: str) -> Optional[Dict[str, str]]:
     
     # Validate article format: 00757-GCTT-EEE-HXX
     # where G – Grit size, C – Diamond %, TT – Blade thickness, EEE – Blade exposure, H – Bond Hardness, XX – Constant
-    if len(article) != 18 or not article.startswith('00757-'):
+    match = ARTICLE_PATTERN.fullmatch(article)
+    if match is None:
         return decoded_params
     
-    # Split the article into parts: 00757, GCTT, EEE, HXX
-    try:
-        parts = article.split('-')
-        if len(parts) != 4:
-            return decoded_params
-        
-        gc_part = parts[1]  # GCTT - G=Grit size, C=Diamond%, TT=Blade thickness
-        eee_part = parts[2]  # EEE - Blade exposure
-        hxx_part = parts[3]  # HXX - H=Bond Hardness, XX=constant (could be 00, 0, etc.)
-        
-        # Extract individual components
-        grit_part = gc_part[0]  # G - Grit size (1 symbol: digit 1-9 or A/B)
-        diamond_part = gc_part[1]  # C - Diamond % (1 symbol: digit 1-5)
-        blade_thickness_part = gc_part[2:4]  # TT - Blade thickness (2 symbols: digits or A0/A1/A2)
-        blade_exposure_part = eee_part  # EEE - Blade exposure (3 digits)
-        bond_hardness_part = hxx_part[0]  # H - Bond hardness (1 symbol: digit 1/2/3)
-        
-        # Find corresponding values in the parameters dataframe
-        # Using positional column indices due to encoding issues with Cyrillic column names
-        # Column 0: Параметр, Column 1: Условное обозначение в артикуле, Column 2: Значение, Column 3: Единица измерения
-        grit_row = params_df[(params_df.iloc[:, 0] == 'Grit Size (Размер алмазного зерна)') &
-                             (params_df.iloc[:, 1] == grit_part)]
-        if not grit_row.empty:
-            decoded_params['grit_size'] = str(grit_row.iloc[0, 2])  # Use column index 2 for Значение
-        
-        diamond_row = params_df[(params_df.iloc[:, 0] == 'Diamond % (Концентрация алмазного зерна)') &
-                                (params_df.iloc[:, 1] == diamond_part)]
-        if not diamond_row.empty:
-            decoded_params['diamond_percent'] = str(diamond_row.iloc[0, 2])  # Use column index 2 for Значение
-        
-        thickness_row = params_df[(params_df.iloc[:, 0] == 'Blade thickness (Толщина лезвия)') &
-                                  (params_df.iloc[:, 1] == blade_thickness_part)]
-        if not thickness_row.empty:
-            decoded_params['blade_thickness'] = str(thickness_row.iloc[0, 2])  # Use column index 2 for Значение
-        
-        exposure_row = params_df[(params_df.iloc[:, 0] == 'Blade exposure (Вылет лезвия)') &
-                                 (params_df.iloc[:, 1] == blade_exposure_part)]
-        if not exposure_row.empty:
-            decoded_params['blade_exposure'] = str(exposure_row.iloc[0, 2])  # Use column index 2 for Значение
+    # The match yields all components in a single scan, in ARTICLE_FIELDS order:
+    # G - Grit size (1 symbol: digit 1-9 or A/B), C - Diamond % (1 symbol: digit 1-5),
+    # TT - Blade thickness (2 symbols: digits or A0/A1/A2), EEE - Blade exposure (3 digits),
+    # H - Bond hardness (1 symbol: digit 1/2/3)
+    # Find corresponding values in the parameters table; unknown codes stay empty
+    for (field, param), code in zip(ARTICLE_FIELDS.items(), match.groups()):
+        decoded_params[field] = lookup.get(param, {}).get(code, '')
+    
+    return decoded_params
+
+
+def decode_article(article: str) -> Optional[Dict[str, str]]:
+    """
+    Decode a disc article to extract its parameters based on the naming convention.
+    
+    Args:
+        article (str): The disc article string (e.g., "00757-1130-250-100")
         
-        hardness_row = params_df[(params_df.iloc[:, 0] == 'Bond hardness (Твёрдость связки)') &
-                                 (params_df.iloc[:, 1] == bond_hardness_part)]
-        if not hardness_row.empty:
-            decoded_params['bond_hardness'] = str(hardness_row.iloc[0, 2])  # Use column index 2 for Значение
+    Returns:
+        Optional[Dict[str, str]]: Decoded parameters or None if invalid
+    """
+    # Load the parameter mapping from the CSV file (read once, then cached);
+    # failures are reported here so they are never memoized
+    try:
+        load_parameter_lookup()
+    except Exception as e:
+        st.error(f"Error loading disc parameters from CSV: {str(e)}")
+        return None
+    
+    # Articles repeat heavily; hand out a copy so callers cannot alter the cached result
+    return dict(_decode_article_cached(article))
+
+
+def decode_articles(articles: pd.Series) -> Optional[pd.DataFrame]:
+    """
+    Decode a whole column of disc articles at once.
+    
+    Produces the same fields as decode_article, one row per article, using
+    vectorized string extraction and dictionary mapping instead of a Python
+    call per article.
+    
+    Args:
+        articles (pd.Series): Disc article strings
         
-        return decoded_params
+    Returns:
+        Optional[pd.DataFrame]: Decoded parameters indexed like the input, or None if
+            the parameter table cannot be loaded
+    """
+    try:
+        lookup = load_parameter_lookup()
     except Exception as e:
-        st.error(f"Error decoding article: {str(e)}")
+        st.error(f"Error loading disc parameters from CSV: {str(e)}")
         return None
+    
+    articles = articles.astype(object)
+    
+    # Only articles matching the whole layout are decoded, as in decode_article
+    valid = articles.str.fullmatch(ARTICLE_PATTERN).fillna(False).astype(bool)
+    parts = articles.where(valid).str.extract(ARTICLE_PATTERN)
+    
+    decoded = pd.DataFrame({'article': articles, 'product_family': PRODUCT_FAMILY}, index=articles.index)
+    for group, (field, param) in enumerate(ARTICLE_FIELDS.items()):
+        decoded[field] = parts[group].map(lookup.get(param, {})).fillna('')
+    
+    return decoded
 
 
 def get_article_info(article: str) -> Dict[str, str]:
@@ -127,17 +181,5 @@ def validate_article_format(article: str) -> bool:
     Returns:
         bool: True if valid, False otherwise
     """
-    # Check if the article has the correct length and prefix
-    if len(article) != 18 or not article.startswith('00757'):
-        return False
-    
-    # Check if it follows the expected pattern (with hyphens in the right places)
-    parts = article.split('-')
-    if len(parts) != 4:
-        return False
-    
-    # Validate individual parts
-    if len(parts[0]) != 5 or len(parts[1]) != 4 or len(parts[2]) != 3 or len(parts[3]) != 3:
-        return False
-    
-    return True
\ No newline at end of file
+    # Same layout check as decode_article: 00757-GCTT-EEE-HXX
+    return ARTICLE_PATTERN.fullmatch(article) is not None
@@ -3,604 +3,365 @@ import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import streamlit as st
-from typing import List, Optional
+from functools import wraps
+from typing import Callable, Iterator, List, NamedTuple, Optional, Tuple
 import numpy as np
 
+from disc_cutting_analyzer.analysis import _convert_numeric_columns
+from disc_cutting_analyzer.analysis_kernels import linear_fit, nan_column_means
 
-def create_chipping_plot(
-    data: pd.DataFrame,
-    selected_materials: List[str],
-    selected_cut_types: List[str],
-    min_thickness: float,
-    max_thickness: float,
-    min_kerf_width: float,
-    max_kerf_width: float
-) -> go.Figure:
+# Fewer points than this give no meaningful trend, so no trend line is drawn
+MIN_TREND_POINTS = 5
+
+
+class SummaryMetrics(NamedTuple):
+    """Key figures of the selected data, rounded to two decimals (0 when no values)."""
+    avg_front_chipping: float
+    avg_back_chipping: float
+    avg_performance: float
+    avg_blade_life: float
+    total_records: int
+
+
+def _placeholder_if_empty(plot_function: Callable[..., go.Figure]) -> Callable[..., go.Figure]:
     """
-    Create an interactive plot showing chipping metrics vs wafer thickness by material.
+    Return a placeholder figure instead of calling the plot function on empty data.
+    
+    The wrapped function takes the filtered data as its first argument; the
+    filtering itself is done (and cached) once per rerun by the caller.
     
     Args:
-        data (pd.DataFrame): Filtered data to plot
-        selected_materials (List[str]): Selected materials
-        selected_cut_types (List[str]): Selected cut types
-        min_thickness (float): Minimum thickness for filtering
-        max_thickness (float): Maximum thickness for filtering
-        min_kerf_width (float): Minimum kerf width for filtering
-        max_kerf_width (float): Maximum kerf width for filtering
+        plot_function (Callable[..., go.Figure]): Function building a figure from the filtered data
         
     Returns:
-        go.Figure: Plotly figure object
+        Callable[..., go.Figure]: Wrapped function with the same signature
     """
-    # Apply filters
-    filtered_data = data[
-        (data['Материал пластины'].isin(selected_materials)) &
-        (data['Тип резки'].isin(selected_cut_types)) &
-        (data['Толщина пластины, мкм'] >= min_thickness) &
-        (data['Толщина пластины, мкм'] <= max_thickness) &
-        (data['Ширина реза, мкм'] >= min_kerf_width) &
-        (data['Ширина реза, мкм'] <= max_kerf_width)
-    ].copy()
+    @wraps(plot_function)
+    def wrapper(filtered_data: pd.DataFrame, *args, **kwargs) -> go.Figure:
+        if filtered_data.empty:
+            fig = go.Figure()
+            fig.add_annotation(text="No data available for selected filters", 
+                              xref="paper", yref="paper",
+                              x=0.5, y=0.5, showarrow=False, font_size=16)
+            return fig
+        return plot_function(filtered_data, *args, **kwargs)
+    
+    return wrapper
+
+
+def _iter_material_cut_groups(
+    filtered_data: pd.DataFrame,
+    selected_materials: List[str],
+    selected_cut_types: List[str]
+) -> Iterator[Tuple[str, str, pd.DataFrame]]:
+    """
+    Yield the rows of each (material, cut type) pair in selection order.
     
-    if filtered_data.empty:
-        fig = go.Figure()
-        fig.add_annotation(text="No data available for selected filters", 
-                          xref="paper", yref="paper",
-                          x=0.5, y=0.5, showarrow=False, font_size=16)
-        return fig
+    The data is grouped once; pairs without rows are skipped.
     
-    # Create subplots for different chipping metrics
-    fig = make_subplots(
-        rows=2, cols=1,
-        subplot_titles=['Front Side Chipping (Median)', 'Back Side Chipping (Median)'],
-        vertical_spacing=0.2
-    )
+    Args:
+        filtered_data (pd.DataFrame): Data already filtered by the user selections
+        selected_materials (List[str]): Selected materials
+        selected_cut_types (List[str]): Selected cut types
+        
+    Yields:
+        Tuple[str, str, pd.DataFrame]: Material, cut type and their rows
+    """
+    groups = dict(iter(filtered_data.groupby(['Материал пластины', 'Тип резки'], observed=True, sort=False)))
     
     for material in selected_materials:
         for cut_type in selected_cut_types:  # Loop through cut types to differentiate them visually
-            material_cut_data = filtered_data[
-                (filtered_data['Материал пластины'] == material) &
-                (filtered_data['Тип резки'] == cut_type)
-            ]
-            
-            if not material_cut_data.empty:
-                # Ensure data is numeric for both axes
-                material_cut_data = material_cut_data.copy()
-                material_cut_data['Толщина пластины, мкм'] = pd.to_numeric(material_cut_data['Толщина пластины, мкм'], errors='coerce')
-                material_cut_data['Сколы лицевая сторона (медиана), мкм'] = pd.to_numeric(material_cut_data['Сколы лицевая сторона (медиана), мкм'], errors='coerce')
-                
-                # Clean the data by removing NaN values
-                clean_front_data = material_cut_data[
-                    material_cut_data['Толщина пластины, мкм'].notna() &
-                    material_cut_data['Сколы лицевая сторона (медиана), мкм'].notna()
-                ]
-                
-                if not clean_front_data.empty:
-                    # Front side chipping
-                    fig.add_trace(
-                        go.Scatter(
-                            x=clean_front_data['Толщина пластины, мкм'],
-                            y=clean_front_data['Сколы лицевая сторона (медиана), мкм'],
-                            mode='markers',
-                            name=f'{material} ({cut_type}) - Front Side',
-                            legendgroup=f'{material}-{cut_type}',
-                            showlegend=True
-                        ),
-                        row=1, col=1
-                    )
-                    
-                    # Add trend line for front side chipping
-                    if len(clean_front_data) > 1:
-                        x_vals = clean_front_data['Толщина пластины, мкм'].values
-                        y_vals = clean_front_data['Сколы лицевая сторона (медиана), мкм'].values
-                        # Ensure both arrays have same length and no NaN values
-                        mask = ~(np.isnan(x_vals) | np.isnan(y_vals))
-                        x_clean = x_vals[mask]
-                        y_clean = y_vals[mask]
-                        
-                        if len(x_clean) > 1:
-                            z = np.polyfit(x_clean, y_clean, 1)
-                            p = np.poly1d(z)
-                            fig.add_trace(
-                                go.Scatter(
-                                    x=x_clean,
-                                    y=p(x_clean),
-                                    mode='lines',
-                                    name=f'{material} ({cut_type}) - Front Side Trend',
-                                    legendgroup=f'{material}-{cut_type}',
-                                    showlegend=False,
-                                    line=dict(dash='dash', width=1)
-                                ),
-                                row=1, col=1
-                            )
-                
-                # Back side chipping (if available)
-                if 'Сколы обратная сторона (медиана), мкм' in material_cut_data.columns:
-                    # Ensure data is numeric for back side
-                    material_cut_data['Сколы обратная сторона (медиана), мкм'] = pd.to_numeric(material_cut_data['Сколы обратная сторона (медиана), мкм'], errors='coerce')
-                    
-                    # Clean the data by removing NaN values
-                    clean_back_data = material_cut_data[
-                        material_cut_data['Толщина пластины, мкм'].notna() &
-                        material_cut_data['Сколы обратная сторона (медиана), мкм'].notna()
-                    ]
-                    
-                    if not clean_back_data.empty:
-                        fig.add_trace(
-                            go.Scatter(
-                                x=clean_back_data['Толщина пластины, мкм'],
-                                y=clean_back_data['Сколы обратная сторона (медиана), мкм'],
-                                mode='markers',
-                                name=f'{material} ({cut_type}) - Back Side',
-                                legendgroup=f'{material}-{cut_type}',
-                                showlegend=True
-                            ),
-                            row=2, col=1
-                        )
-                        
-                        # Add trend line for back side chipping
-                        if len(clean_back_data) > 1:
-                            x_vals = clean_back_data['Толщина пластины, мкм'].values
-                            y_vals = clean_back_data['Сколы обратная сторона (медиана), мкм'].values
-                            # Ensure both arrays have same length and no NaN values
-                            mask = ~(np.isnan(x_vals) | np.isnan(y_vals))
-                            x_clean = x_vals[mask]
-                            y_clean = y_vals[mask]
-                            
-                            if len(x_clean) > 1:
-                                z = np.polyfit(x_clean, y_clean, 1)
-                                p = np.poly1d(z)
-                                fig.add_trace(
-                                    go.Scatter(
-                                        x=x_clean,
-                                        y=p(x_clean),
-                                        mode='lines',
-                                        name=f'{material} ({cut_type}) - Back Side Trend',
-                                        legendgroup=f'{material}-{cut_type}',
-                                        showlegend=False,
-                                        line=dict(dash='dash', width=1)
-                                    ),
-                                    row=2, col=1
-                                )
+            material_cut_data = groups.get((material, cut_type))
+            if material_cut_data is not None:
+                yield material, cut_type, material_cut_data
+
+
+def _subplot_layout(
+    subplot_titles: List[str],
+    vertical_spacing: float,
+    y_titles: List[str],
+    title: str,
+    height: int
+) -> dict:
+    """
+    Build the layout of a one-column subplot figure with thickness on every x axis.
     
-    fig.update_xaxes(title_text="Wafer Thickness (μm)", row=1, col=1)
-    fig.update_xaxes(title_text="Wafer Thickness (μm)", row=2, col=1)
-    fig.update_yaxes(title_text="Chipping (μm)", row=1, col=1)
-    fig.update_yaxes(title_text="Chipping (μm)", row=2, col=1)
+    The layouts do not depend on the data, so they are built once at import
+    and the plot functions pass traces straight to go.Figure instead of
+    running make_subplots and add_traces on every call.
     
-    fig.update_layout(
-        title="Chipping Metrics vs Wafer Thickness by Material",
-        height=800,
-        hovermode='x unified'
+    Args:
+        subplot_titles (List[str]): Title of each subplot, top to bottom
+        vertical_spacing (float): Space between subplots
+        y_titles (List[str]): Y axis title of each subplot
+        title (str): Figure title
+        height (int): Figure height in pixels
+        
+    Returns:
+        dict: Layout dict; traces refer to its axes as 'x'/'y', 'x2'/'y2', ...
+    """
+    fig = make_subplots(
+        rows=len(subplot_titles), cols=1,
+        subplot_titles=subplot_titles,
+        vertical_spacing=vertical_spacing
     )
     
-    return fig
+    for row, y_title in enumerate(y_titles, start=1):
+        fig.update_xaxes(title_text="Wafer Thickness (μm)", row=row, col=1)
+        fig.update_yaxes(title_text=y_title, row=row, col=1)
+    
+    fig.update_layout(title=title, height=height, hovermode='x unified')
+    return fig.layout.to_plotly_json()
+
+
+_CHIPPING_LAYOUT = _subplot_layout(
+    ['Front Side Chipping (Median)', 'Back Side Chipping (Median)'], 0.2,
+    ["Chipping (μm)", "Chipping (μm)"],
+    "Chipping Metrics vs Wafer Thickness by Material", 800
+)
+
+_PERFORMANCE_LAYOUT = _subplot_layout(
+    ['Performance (pcs/hour)', 'Blade Life (cuts)'], 0.2,
+    ["Performance (pcs/hour)", "Blade Life (cuts)"],
+    "Performance Metrics vs Wafer Thickness by Material", 800
+)
+
+_PROCESS_PARAMETERS_LAYOUT = _subplot_layout(
+    ['Kerf Width (μm)', 'Feed Rate (mm/s)', 'Spindle Speed (RPM)'], 0.15,
+    ["Width (μm)", "Rate (mm/s)", "Speed (RPM)"],
+    "Process Parameters vs Wafer Thickness by Material", 1000
+)
+
+
+def _marker_and_trend_traces(
+    rows: pd.DataFrame,
+    y_column: str,
+    row: int,
+    name: str,
+    legendgroup: str,
+    showlegend: bool = True
+) -> List[dict]:
+    """
+    Build the marker trace of one column against thickness and its trend line.
+
+    Traces are plain dicts validated once by the figure constructor. Arrays are
+    passed as float32 so Plotly ships half the bytes to the browser, and the
+    trend line only carries its two end points.
+
+    Args:
+        rows (pd.DataFrame): Rows of one (material, cut type) pair
+        y_column (str): Column plotted against wafer thickness
+        row (int): Subplot row, 1-based
+        name (str): Trace name; the trend line gets ' Trend' appended
+        legendgroup (str): Legend group shared by the pair's traces
+        showlegend (bool): Whether the marker trace appears in the legend
+
+    Returns:
+        List[dict]: No traces without data, the marker trace, plus the trend
+        line when there are at least MIN_TREND_POINTS points
+    """
+    # Clean the data by removing NaN values
+    clean_data = rows.dropna(subset=['Толщина пластины, мкм', y_column])
+    if clean_data.empty:
+        return []
+
+    x_clean = clean_data['Толщина пластины, мкм'].to_numpy(dtype=np.float32)
+    y_clean = clean_data[y_column].to_numpy(dtype=np.float32)
+    axes = dict(xaxis='x', yaxis='y') if row == 1 else dict(xaxis=f'x{row}', yaxis=f'y{row}')
+
+    traces = [
+        dict(
+            type='scattergl',
+            **axes,
+            x=x_clean,
+            y=y_clean,
+            mode='markers',
+            name=name,
+            legendgroup=legendgroup,
+            showlegend=showlegend
+        )
+    ]
+
+    if len(clean_data) >= MIN_TREND_POINTS:
+        slope, intercept = linear_fit(x_clean, y_clean)
+        x_end = np.array([x_clean.min(), x_clean.max()], dtype=np.float32)
+        traces.append(
+            dict(
+                type='scatter',
+                **axes,
+                x=x_end,
+                y=slope * x_end + intercept,
+                mode='lines',
+                name=f'{name} Trend',
+                legendgroup=legendgroup,
+                showlegend=False,
+                line=dict(dash='dash', width=1)
+            )
+        )
+
+    return traces
+
+
+@_placeholder_if_empty
+def create_chipping_plot(
+    filtered_data: pd.DataFrame,
+    selected_materials: List[str],
+    selected_cut_types: List[str]
+) -> go.Figure:
+    """
+    Create an interactive plot showing chipping metrics vs wafer thickness by material.
+
+    Args:
+        filtered_data (pd.DataFrame): Data already filtered by the user selections
+        selected_materials (List[str]): Selected materials
+        selected_cut_types (List[str]): Selected cut types
+
+    Returns:
+        go.Figure: Plotly figure object
+    """
+    # Ensure the plotted columns are numeric once (no-op for loaded data)
+    filtered_data = _convert_numeric_columns(
+        filtered_data,
+        ['Толщина пластины, мкм', 'Сколы лицевая сторона (медиана), мкм', 'Сколы обратная сторона (медиана), мкм']
+    )
 
+    traces = []
 
+    # One groupby pass instead of two equality masks per (material, cut type)
+    for material, cut_type, material_cut_data in _iter_material_cut_groups(
+        filtered_data, selected_materials, selected_cut_types
+    ):
+        legendgroup = f'{material}-{cut_type}'
+
+        # Front side chipping
+        traces += _marker_and_trend_traces(
+            material_cut_data, 'Сколы лицевая сторона (медиана), мкм', 1,
+            f'{material} ({cut_type}) - Front Side', legendgroup
+        )
+
+        # Back side chipping (if available)
+        if 'Сколы обратная сторона (медиана), мкм' in material_cut_data.columns:
+            traces += _marker_and_trend_traces(
+                material_cut_data, 'Сколы обратная сторона (медиана), мкм', 2,
+                f'{material} ({cut_type}) - Back Side', legendgroup
+            )
+
+    return go.Figure(data=traces, layout=_CHIPPING_LAYOUT)
+
+
+@_placeholder_if_empty
 def create_performance_plot(
-    data: pd.DataFrame,
+    filtered_data: pd.DataFrame,
     selected_materials: List[str],
-    selected_cut_types: List[str],
-    min_thickness: float,
-    max_thickness: float,
-    min_kerf_width: float,
-    max_kerf_width: float
+    selected_cut_types: List[str]
 ) -> go.Figure:
     """
     Create an interactive plot showing performance metrics vs wafer thickness by material.
-    
+
     Args:
-        data (pd.DataFrame): Filtered data to plot
+        filtered_data (pd.DataFrame): Data already filtered by the user selections
         selected_materials (List[str]): Selected materials
         selected_cut_types (List[str]): Selected cut types
-        min_thickness (float): Minimum thickness for filtering
-        max_thickness (float): Maximum thickness for filtering
-        min_kerf_width (float): Minimum kerf width for filtering
-        max_kerf_width (float): Maximum kerf width for filtering
-        
+
     Returns:
         go.Figure: Plotly figure object
     """
-    # Apply filters
-    filtered_data = data[
-        (data['Материал пластины'].isin(selected_materials)) &
-        (data['Тип резки'].isin(selected_cut_types)) &
-        (data['Толщина пластины, мкм'] >= min_thickness) &
-        (data['Толщина пластины, мкм'] <= max_thickness) &
-        (data['Ширина реза, мкм'] >= min_kerf_width) &
-        (data['Ширина реза, мкм'] <= max_kerf_width)
-    ].copy()
-    
-    if filtered_data.empty:
-        fig = go.Figure()
-        fig.add_annotation(text="No data available for selected filters", 
-                          xref="paper", yref="paper",
-                          x=0.5, y=0.5, showarrow=False, font_size=16)
-        return fig
-    
-    # Create subplots for performance and blade life
-    fig = make_subplots(
-        rows=2, cols=1,
-        subplot_titles=['Performance (pcs/hour)', 'Blade Life (cuts)'],
-        vertical_spacing=0.2
-    )
-    
-    for material in selected_materials:
-        for cut_type in selected_cut_types:  # Loop through cut types to differentiate them visually
-            material_cut_data = filtered_data[
-                (filtered_data['Материал пластины'] == material) &
-                (filtered_data['Тип резки'] == cut_type)
-            ]
-            
-            if not material_cut_data.empty:
-                # Ensure data is numeric for performance
-                material_cut_data = material_cut_data.copy()
-                material_cut_data['Толщина пластины, мкм'] = pd.to_numeric(material_cut_data['Толщина пластины, мкм'], errors='coerce')
-                material_cut_data['Производительность, шт/час'] = pd.to_numeric(material_cut_data['Производительность, шт/час'], errors='coerce')
-                
-                # Clean the data by removing NaN values
-                clean_perf_data = material_cut_data[
-                    material_cut_data['Толщина пластины, мкм'].notna() &
-                    material_cut_data['Производительность, шт/час'].notna()
-                ]
-                
-                if not clean_perf_data.empty:
-                    # Performance
-                    fig.add_trace(
-                        go.Scatter(
-                            x=clean_perf_data['Толщина пластины, мкм'],
-                            y=clean_perf_data['Производительность, шт/час'],
-                            mode='markers',
-                            name=f'{material} ({cut_type}) - Performance',
-                            legendgroup=f'{material}-{cut_type}',
-                            showlegend=True
-                        ),
-                        row=1, col=1
-                    )
-                    
-                    # Add trend line for performance
-                    if len(clean_perf_data) > 1:
-                        x_vals = clean_perf_data['Толщина пластины, мкм'].values
-                        y_vals = clean_perf_data['Производительность, шт/час'].values
-                        # Ensure both arrays have same length and no NaN values
-                        mask = ~(np.isnan(x_vals) | np.isnan(y_vals))
-                        x_clean = x_vals[mask]
-                        y_clean = y_vals[mask]
-                        
-                        if len(x_clean) > 1:
-                            z = np.polyfit(x_clean, y_clean, 1)
-                            p = np.poly1d(z)
-                            fig.add_trace(
-                                go.Scatter(
-                                    x=x_clean,
-                                    y=p(x_clean),
-                                    mode='lines',
-                                    name=f'{material} ({cut_type}) - Performance Trend',
-                                    legendgroup=f'{material}-{cut_type}',
-                                    showlegend=False,
-                                    line=dict(dash='dash', width=1)
-                                ),
-                                row=1, col=1
-                            )
-                
-                # Blade life
-                # Ensure data is numeric for blade life
-                material_cut_data['Срок службы диска, резов'] = pd.to_numeric(material_cut_data['Срок службы диска, резов'], errors='coerce')
-                
-                # Clean the data by removing NaN values
-                clean_blade_data = material_cut_data[
-                    material_cut_data['Толщина пластины, мкм'].notna() &
-                    material_cut_data['Срок службы диска, резов'].notna()
-                ]
-                
-                if not clean_blade_data.empty:
-                    fig.add_trace(
-                        go.Scatter(
-                            x=clean_blade_data['Толщина пластины, мкм'],
-                            y=clean_blade_data['Срок службы диска, резов'],
-                            mode='markers',
-                            name=f'{material} ({cut_type}) - Blade Life',
-                            legendgroup=f'{material}-{cut_type}',
-                            showlegend=True
-                        ),
-                        row=2, col=1
-                    )
-                    
-                    # Add trend line for blade life
-                    if len(clean_blade_data) > 1:
-                        x_vals = clean_blade_data['Толщина пластины, мкм'].values
-                        y_vals = clean_blade_data['Срок службы диска, резов'].values
-                        # Ensure both arrays have same length and no NaN values
-                        mask = ~(np.isnan(x_vals) | np.isnan(y_vals))
-                        x_clean = x_vals[mask]
-                        y_clean = y_vals[mask]
-                        
-                        if len(x_clean) > 1:
-                            z = np.polyfit(x_clean, y_clean, 1)
-                            p = np.poly1d(z)
-                            fig.add_trace(
-                                go.Scatter(
-                                    x=x_clean,
-                                    y=p(x_clean),
-                                    mode='lines',
-                                    name=f'{material} ({cut_type}) - Blade Life Trend',
-                                    legendgroup=f'{material}-{cut_type}',
-                                    showlegend=False,
-                                    line=dict(dash='dash', width=1)
-                                ),
-                                row=2, col=1
-                            )
-    
-    fig.update_xaxes(title_text="Wafer Thickness (μm)", row=1, col=1)
-    fig.update_xaxes(title_text="Wafer Thickness (μm)", row=2, col=1)
-    fig.update_yaxes(title_text="Performance (pcs/hour)", row=1, col=1)
-    fig.update_yaxes(title_text="Blade Life (cuts)", row=2, col=1)
-    
-    fig.update_layout(
-        title="Performance Metrics vs Wafer Thickness by Material",
-        height=800,
-        hovermode='x unified'
+    # Ensure the plotted columns are numeric once (no-op for loaded data)
+    filtered_data = _convert_numeric_columns(
+        filtered_data,
+        ['Толщина пластины, мкм', 'Производительность, шт/час', 'Срок службы диска, резов']
     )
-    
-    return fig
 
+    traces = []
+
+    # One groupby pass instead of two equality masks per (material, cut type)
+    for material, cut_type, material_cut_data in _iter_material_cut_groups(
+        filtered_data, selected_materials, selected_cut_types
+    ):
+        legendgroup = f'{material}-{cut_type}'
+
+        # Performance
+        traces += _marker_and_trend_traces(
+            material_cut_data, 'Производительность, шт/час', 1,
+            f'{material} ({cut_type}) - Performance', legendgroup
+        )
 
+        # Blade life
+        traces += _marker_and_trend_traces(
+            material_cut_data, 'Срок службы диска, резов', 2,
+            f'{material} ({cut_type}) - Blade Life', legendgroup
+        )
+
+    return go.Figure(data=traces, layout=_PERFORMANCE_LAYOUT)
+
+
+@_placeholder_if_empty
 def create_process_parameters_plot(
-    data: pd.DataFrame,
+    filtered_data: pd.DataFrame,
     selected_materials: List[str],
-    selected_cut_types: List[str],
-    min_thickness: float,
-    max_thickness: float,
-    min_kerf_width: float,
-    max_kerf_width: float
+    selected_cut_types: List[str]
 ) -> go.Figure:
     """
     Create an interactive plot showing process parameters vs wafer thickness by material.
-    
+
     Args:
-        data (pd.DataFrame): Filtered data to plot
+        filtered_data (pd.DataFrame): Data already filtered by the user selections
         selected_materials (List[str]): Selected materials
         selected_cut_types (List[str]): Selected cut types
-        min_thickness (float): Minimum thickness for filtering
-        max_thickness (float): Maximum thickness for filtering
-        min_kerf_width (float): Minimum kerf width for filtering
-        max_kerf_width (float): Maximum kerf width for filtering
-        
+
     Returns:
         go.Figure: Plotly figure object
     """
-    # Apply filters
-    filtered_data = data[
-        (data['Материал пластины'].isin(selected_materials)) &
-        (data['Тип резки'].isin(selected_cut_types)) &
-        (data['Толщина пластины, мкм'] >= min_thickness) &
-        (data['Толщина пластины, мкм'] <= max_thickness) &
-        (data['Ширина реза, мкм'] >= min_kerf_width) &
-        (data['Ширина реза, мкм'] <= max_kerf_width)
-    ].copy()
-    
-    if filtered_data.empty:
-        fig = go.Figure()
-        fig.add_annotation(text="No data available for selected filters", 
-                          xref="paper", yref="paper",
-                          x=0.5, y=0.5, showarrow=False, font_size=16)
-        return fig
-    
-    # Create subplots for process parameters
-    fig = make_subplots(
-        rows=3, cols=1,
-        subplot_titles=['Kerf Width (μm)', 'Feed Rate (mm/s)', 'Spindle Speed (RPM)'],
-        vertical_spacing=0.15
+    # Ensure the plotted columns are numeric once (no-op for loaded data)
+    filtered_data = _convert_numeric_columns(
+        filtered_data,
+        ['Толщина пластины, мкм', 'Ширина реза, мкм', 'Скорость подачи, мм/с', 'Частота оборотов шпинделя, об/мин']
     )
-    
-    for material in selected_materials:
-        for cut_type in selected_cut_types:  # Loop through cut types to differentiate them visually
-            material_cut_data = filtered_data[
-                (filtered_data['Материал пластины'] == material) &
-                (filtered_data['Тип резки'] == cut_type)
-            ]
-            
-            if not material_cut_data.empty:
-                # Ensure data is numeric for all parameters
-                material_cut_data = material_cut_data.copy()
-                material_cut_data['Толщина пластины, мкм'] = pd.to_numeric(material_cut_data['Толщина пластины, мкм'], errors='coerce')
-                material_cut_data['Ширина реза, мкм'] = pd.to_numeric(material_cut_data['Ширина реза, мкм'], errors='coerce')
-                
-                # Clean the data by removing NaN values
-                clean_kerf_data = material_cut_data[
-                    material_cut_data['Толщина пластины, мкм'].notna() &
-                    material_cut_data['Ширина реза, мкм'].notna()
-                ]
-                
-                if not clean_kerf_data.empty:
-                    # Kerf width
-                    fig.add_trace(
-                        go.Scatter(
-                            x=clean_kerf_data['Толщина пластины, мкм'],
-                            y=clean_kerf_data['Ширина реза, мкм'],
-                            mode='markers',
-                            name=f'{material} ({cut_type}) - Kerf Width',
-                            legendgroup=f'{material}-{cut_type}',
-                            showlegend=True
-                        ),
-                        row=1, col=1
-                    )
-                    
-                    # Add trend line for kerf width
-                    if len(clean_kerf_data) > 1:
-                        x_vals = clean_kerf_data['Толщина пластины, мкм'].values
-                        y_vals = clean_kerf_data['Ширина реза, мкм'].values
-                        # Ensure both arrays have same length and no NaN values
-                        mask = ~(np.isnan(x_vals) | np.isnan(y_vals))
-                        x_clean = x_vals[mask]
-                        y_clean = y_vals[mask]
-                        
-                        if len(x_clean) > 1:
-                            z = np.polyfit(x_clean, y_clean, 1)
-                            p = np.poly1d(z)
-                            fig.add_trace(
-                                go.Scatter(
-                                    x=x_clean,
-                                    y=p(x_clean),
-                                    mode='lines',
-                                    name=f'{material} ({cut_type}) - Kerf Width Trend',
-                                    legendgroup=f'{material}-{cut_type}',
-                                    showlegend=False,
-                                    line=dict(dash='dash', width=1)
-                                ),
-                                row=1, col=1
-                            )
-                
-                # Feed rate
-                material_cut_data['Скорость подачи, мм/с'] = pd.to_numeric(material_cut_data['Скорость подачи, мм/с'], errors='coerce')
-                
-                # Clean the data by removing NaN values
-                clean_feed_data = material_cut_data[
-                    material_cut_data['Толщина пластины, мкм'].notna() &
-                    material_cut_data['Скорость подачи, мм/с'].notna()
-                ]
-                
-                if not clean_feed_data.empty:
-                    fig.add_trace(
-                        go.Scatter(
-                            x=clean_feed_data['Толщина пластины, мкм'],
-                            y=clean_feed_data['Скорость подачи, мм/с'],
-                            mode='markers',
-                            name=f'{material} ({cut_type}) - Feed Rate',
-                            legendgroup=f'{material}-{cut_type}',
-                            showlegend=False
-                        ),
-                        row=2, col=1
-                    )
-                    
-                    # Add trend line for feed rate
-                    if len(clean_feed_data) > 1:
-                        x_vals = clean_feed_data['Толщина пластины, мкм'].values
-                        y_vals = clean_feed_data['Скорость подачи, мм/с'].values
-                        # Ensure both arrays have same length and no NaN values
-                        mask = ~(np.isnan(x_vals) | np.isnan(y_vals))
-                        x_clean = x_vals[mask]
-                        y_clean = y_vals[mask]
-                        
-                        if len(x_clean) > 1:
-                            z = np.polyfit(x_clean, y_clean, 1)
-                            p = np.poly1d(z)
-                            fig.add_trace(
-                                go.Scatter(
-                                    x=x_clean,
-                                    y=p(x_clean),
-                                    mode='lines',
-                                    name=f'{material} ({cut_type}) - Feed Rate Trend',
-                                    legendgroup=f'{material}-{cut_type}',
-                                    showlegend=False,
-                                    line=dict(dash='dash', width=1)
-                                ),
-                                row=2, col=1
-                            )
-                
-                # Spindle speed
-                material_cut_data['Частота оборотов шпинделя, об/мин'] = pd.to_numeric(material_cut_data['Частота оборотов шпинделя, об/мин'], errors='coerce')
-                
-                # Clean the data by removing NaN values
-                clean_spindle_data = material_cut_data[
-                    material_cut_data['Толщина пластины, мкм'].notna() &
-                    material_cut_data['Частота оборотов шпинделя, об/мин'].notna()
-                ]
-                
-                if not clean_spindle_data.empty:
-                    fig.add_trace(
-                        go.Scatter(
-                            x=clean_spindle_data['Толщина пластины, мкм'],
-                            y=clean_spindle_data['Частота оборотов шпинделя, об/мин'],
-                            mode='markers',
-                            name=f'{material} ({cut_type}) - Spindle Speed',
-                            legendgroup=f'{material}-{cut_type}',
-                            showlegend=False
-                        ),
-                        row=3, col=1
-                    )
-                    
-                    # Add trend line for spindle speed
-                    if len(clean_spindle_data) > 1:
-                        x_vals = clean_spindle_data['Толщина пластины, мкм'].values
-                        y_vals = clean_spindle_data['Частота оборотов шпинделя, об/мин'].values
-                        # Ensure both arrays have same length and no NaN values
-                        mask = ~(np.isnan(x_vals) | np.isnan(y_vals))
-                        x_clean = x_vals[mask]
-                        y_clean = y_vals[mask]
-                        
-                        if len(x_clean) > 1:
-                            z = np.polyfit(x_clean, y_clean, 1)
-                            p = np.poly1d(z)
-                            fig.add_trace(
-                                go.Scatter(
-                                    x=x_clean,
-                                    y=p(x_clean),
-                                    mode='lines',
-                                    name=f'{material} ({cut_type}) - Spindle Speed Trend',
-                                    legendgroup=f'{material}-{cut_type}',
-                                    showlegend=False,
-                                    line=dict(dash='dash', width=1)
-                                ),
-                                row=3, col=1
-                            )
-    
-    fig.update_xaxes(title_text="Wafer Thickness (μm)", row=1, col=1)
-    fig.update_xaxes(title_text="Wafer Thickness (μm)", row=2, col=1)
-    fig.update_xaxes(title_text="Wafer Thickness (μm)", row=3, col=1)
-    fig.update_yaxes(title_text="Width (μm)", row=1, col=1)
-    fig.update_yaxes(title_text="Rate (mm/s)", row=2, col=1)
-    fig.update_yaxes(title_text="Speed (RPM)", row=3, col=1)
-    
-    fig.update_layout(
-        title="Process Parameters vs Wafer Thickness by Material",
-        height=1000,
-        hovermode='x unified'
-    )
-    
-    return fig
+
+    traces = []
+
+    # One groupby pass instead of two equality masks per (material, cut type)
+    for material, cut_type, material_cut_data in _iter_material_cut_groups(
+        filtered_data, selected_materials, selected_cut_types
+    ):
+        legendgroup = f'{material}-{cut_type}'
+
+        # Kerf width
+        traces += _marker_and_trend_traces(
+            material_cut_data, 'Ширина реза, мкм', 1,
+            f'{material} ({cut_type}) - Kerf Width', legendgroup
+        )
+
+        # Feed rate and spindle speed share the kerf width legend entry
+        traces += _marker_and_trend_traces(
+            material_cut_data, 'Скорость подачи, мм/с', 2,
+            f'{material} ({cut_type}) - Feed Rate', legendgroup, showlegend=False
+        )
+        traces += _marker_and_trend_traces(
+            material_cut_data, 'Частота оборотов шпинделя, об/мин', 3,
+            f'{material} ({cut_type}) - Spindle Speed', legendgroup, showlegend=False
+        )
+
+    return go.Figure(data=traces, layout=_PROCESS_PARAMETERS_LAYOUT)
 
 
+@_placeholder_if_empty
 def create_disc_parameters_plot(
-    data: pd.DataFrame,
-    selected_materials: List[str],
-    selected_cut_types: List[str],
+    filtered_data: pd.DataFrame,
     min_thickness: float,
-    max_thickness: float,
-    min_kerf_width: float,
-    max_kerf_width: float
+    max_thickness: float
 ) -> go.Figure:
     """
     Create an interactive plot showing disc parameters vs wafer thickness by material.
     
     Args:
-        data (pd.DataFrame): Filtered data to plot
-        selected_materials (List[str]): Selected materials
-        selected_cut_types (List[str]): Selected cut types
-        min_thickness (float): Minimum thickness for filtering
-        max_thickness (float): Maximum thickness for filtering
-        min_kerf_width (float): Minimum kerf width for filtering
-        max_kerf_width (float): Maximum kerf width for filtering
+        filtered_data (pd.DataFrame): Data already filtered by the user selections
+        min_thickness (float): Lower bound of the selected thickness range
+        max_thickness (float): Upper bound of the selected thickness range
         
     Returns:
         go.Figure: Plotly figure object
     """
-    # Apply filters
-    filtered_data = data[
-        (data['Материал пластины'].isin(selected_materials)) &
-        (data['Тип резки'].isin(selected_cut_types)) &
-        (data['Толщина пластины, мкм'] >= min_thickness) &
-        (data['Толщина пластины, мкм'] <= max_thickness) &
-        (data['Ширина реза, мкм'] >= min_kerf_width) &
-        (data['Ширина реза, мкм'] <= max_kerf_width)
-    ].copy()
-    
-    if filtered_data.empty:
-        fig = go.Figure()
-        fig.add_annotation(text="No data available for selected filters", 
-                          xref="paper", yref="paper",
-                          x=0.5, y=0.5, showarrow=False, font_size=16)
-        return fig
-    
     # Create subplots for disc parameters
     fig = make_subplots(
         rows=2, cols=1,
@@ -608,36 +369,13 @@ def create_disc_parameters_plot(
         vertical_spacing=0.1
     )
     
-    for material in selected_materials:
-        material_data = filtered_data[filtered_data['Материал пластины'] == material]
-        
-        if not material_data.empty:
-            # Note: We can't plot disc parameters directly from the main data
-            # because the disc parameters are encoded in the article number
-            # So we'll just show a placeholder for now
-            fig.add_trace(
-                go.Scatter(
-                    x=[min_thickness, max_thickness],
-                    y=[0, 0],
-                    mode='lines',
-                    name=f'{material}',
-                    showlegend=False,
-                    line=dict(color='rgba(0,0,0,0)')
-                ),
-                row=1, col=1
-            )
-            
-            fig.add_trace(
-                go.Scatter(
-                    x=[min_thickness, max_thickness],
-                    y=[0, 0],
-                    mode='lines',
-                    name=f'{material}',
-                    showlegend=False,
-                    line=dict(color='rgba(0,0,0,0)')
-                ),
-                row=2, col=1
-            )
+    # Note: We can't plot disc parameters directly from the main data
+    # because the disc parameters are encoded in the article number
+    # So we'll just show the selected thickness range as a placeholder
+    fig.update_xaxes(range=[min_thickness, max_thickness])
+    # Keep the y axes centred on 0, as they were autoscaled around the
+    # invisible y=0 traces this plot used to draw
+    fig.update_yaxes(range=[-1, 1])
     
     fig.update_xaxes(title_text="Wafer Thickness (μm)", row=1, col=1)
     fig.update_xaxes(title_text="Wafer Thickness (μm)", row=2, col=1)
@@ -667,74 +405,33 @@ def create_disc_parameters_plot(
 
 
 def create_summary_metrics(
-    data: pd.DataFrame,
-    selected_materials: List[str],
-    selected_cut_types: List[str],
-    min_thickness: float,
-    max_thickness: float,
-    min_kerf_width: float,
-    max_kerf_width: float
-) -> dict:
+    filtered_data: pd.DataFrame
+) -> SummaryMetrics:
     """
     Calculate summary metrics for the selected data.
     
     Args:
-        data (pd.DataFrame): Filtered data to calculate metrics for
-        selected_materials (List[str]): Selected materials
-        selected_cut_types (List[str]): Selected cut types
-        min_thickness (float): Minimum thickness for filtering
-        max_thickness (float): Maximum thickness for filtering
-        min_kerf_width (float): Minimum kerf width for filtering
-        max_kerf_width (float): Maximum kerf width for filtering
+        filtered_data (pd.DataFrame): Data already filtered by the user selections
         
     Returns:
-        dict: Dictionary containing calculated metrics
+        SummaryMetrics: Calculated metrics
     """
-    # Apply filters
-    filtered_data = data[
-        (data['Материал пластины'].isin(selected_materials)) &
-        (data['Тип резки'].isin(selected_cut_types)) &
-        (data['Толщина пластины, мкм'] >= min_thickness) &
-        (data['Толщина пластины, мкм'] <= max_thickness) &
-        (data['Ширина реза, мкм'] >= min_kerf_width) &
-        (data['Ширина реза, мкм'] <= max_kerf_width)
-    ].copy()
-    
     if filtered_data.empty:
-        return {
-            'avg_front_chipping': 0,
-            'avg_back_chipping': 0,
-            'avg_performance': 0,
-            'avg_blade_life': 0,
-            'total_records': 0
-        }
+        return SummaryMetrics(0.0, 0.0, 0.0, 0.0, 0)
     
-    # Calculate metrics - convert to numeric first, handling non-numeric values
+    # Calculate metrics
     front_chipping_col = 'Сколы лицевая сторона (медиана), мкм'
     performance_col = 'Производительность, шт/час'
     blade_life_col = 'Срок службы диска, резов'
     back_chipping_col = 'Сколы обратная сторона (медиана), мкм'
     
-    # Convert columns to numeric, coercing errors to NaN
-    filtered_data[front_chipping_col] = pd.to_numeric(filtered_data[front_chipping_col], errors='coerce')
-    filtered_data[performance_col] = pd.to_numeric(filtered_data[performance_col], errors='coerce')
-    filtered_data[blade_life_col] = pd.to_numeric(filtered_data[blade_life_col], errors='coerce')
-    filtered_data[back_chipping_col] = pd.to_numeric(filtered_data[back_chipping_col], errors='coerce')
+    # The loader already coerced these columns; only other frames are converted here
+    metric_columns = [front_chipping_col, back_chipping_col, performance_col, blade_life_col]
+    filtered_data = _convert_numeric_columns(filtered_data, metric_columns)
     
-    avg_front_chipping = filtered_data[front_chipping_col].mean()
-    avg_performance = filtered_data[performance_col].mean()
-    avg_blade_life = filtered_data[blade_life_col].mean()
-    
-    # Handle back chipping separately as it might not be available for all records
-    back_chipping_data = filtered_data[
-        filtered_data[back_chipping_col].notna()
-    ]
-    avg_back_chipping = back_chipping_data[back_chipping_col].mean() if not back_chipping_data.empty else 0
+    # One pass over a (rows x 4) block instead of a mean per column; NaN are
+    # skipped, as in Series.mean, and a column without values averages to 0
+    means = nan_column_means(filtered_data[metric_columns].to_numpy(dtype=np.float64))
     
-    return {
-        'avg_front_chipping': round(avg_front_chipping, 2) if pd.notna(avg_front_chipping) else 0,
-        'avg_back_chipping': round(avg_back_chipping, 2) if pd.notna(avg_back_chipping) else 0,
-        'avg_performance': round(avg_performance, 2) if pd.notna(avg_performance) else 0,
-        'avg_blade_life': round(avg_blade_life, 2) if pd.notna(avg_blade_life) else 0,
-        'total_records': len(filtered_data)
-    }
\ No newline at end of file
+    # metric_columns follows the field order of SummaryMetrics
+    return SummaryMetrics(*means.round(2).tolist(), total_records=len(filtered_data))
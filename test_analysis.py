@@ -6,6 +6,7 @@ import os
 # Add the current directory to the path to import from disc_cutting_analyzer
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 from disc_cutting_analyzer.analysis import (
+    compute_mask,
     filter_data,
     get_material_statistics,
     get_cut_type_analysis,
@@ -15,9 +16,10 @@ from disc_cutting_analyzer.analysis import (
     compare_materials,
     get_performance_trends
 )
+from disc_cutting_analyzer.plotting import SummaryMetrics, create_summary_metrics
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def sample_dataframe():
     """Create a sample DataFrame for testing."""
     data = {
@@ -36,7 +38,14 @@ def sample_dataframe():
     return pd.DataFrame(data)
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
+def float32_dataframe(sample_dataframe):
+    """Sample data with its fractional columns stored as float32, as the data loader does."""
+    float_columns = sample_dataframe.select_dtypes(include='float64').columns
+    return sample_dataframe.astype({col: 'float32' for col in float_columns})
+
+
+@pytest.fixture(scope='module')
 def empty_dataframe():
     """Create an empty DataFrame for testing."""
     columns = [
@@ -49,7 +58,7 @@ def empty_dataframe():
     return pd.DataFrame(columns=columns)
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def dataframe_with_nans():
     """Create a DataFrame with some NaN values for testing."""
     data = {
@@ -119,6 +128,47 @@ class TestFilterData:
         assert len(result) == 0
 
 
+class TestComputeMask:
+    """Test cases for the compute_mask function."""
+    
+    def test_compute_mask_matches_filter_data(self, sample_dataframe):
+        """Test that the mask selects the same rows as filter_data."""
+        args = (['Si'], ['Dry'], 300, 400, 30, 35)
+        mask = compute_mask(sample_dataframe, *args)
+        
+        assert isinstance(mask, np.ndarray)
+        assert mask.dtype == bool
+        assert len(mask) == len(sample_dataframe)
+        assert sample_dataframe[mask].equals(filter_data(sample_dataframe, *args))
+    
+    def test_compute_mask_categorical_columns(self, sample_dataframe):
+        """Test that categorical columns give the same mask as object columns."""
+        categorical = sample_dataframe.astype({'Материал пластины': 'category', 'Тип резки': 'category'})
+        args = (['Si', 'NonExistent'], ['Dry', 'Wet'], 0, 1000, 0, 100)
+        
+        expected = compute_mask(sample_dataframe, *args)
+        
+        np.testing.assert_array_equal(compute_mask(categorical, *args), expected)
+    
+    def test_compute_mask_sorted_by_thickness(self, sample_dataframe):
+        """Test that the binary search path selects the same rows on sorted data."""
+        sorted_data = sample_dataframe.sort_values('Толщина пластины, мкм', ignore_index=True)
+        args = (['Si', 'GaAs'], ['Dry', 'Wet'], 300, 450, 0, 100)
+        
+        expected = compute_mask(sorted_data, *args)
+        
+        np.testing.assert_array_equal(compute_mask(sorted_data, *args, thickness_sorted=True), expected)
+    
+    def test_compute_mask_reordered_data(self, sample_dataframe):
+        """Test that frames in any other row order are filtered correctly by default."""
+        reordered = pd.concat([sample_dataframe, sample_dataframe]).sort_values('Производительность, шт/час')
+        args = (['Si', 'GaAs'], ['Dry', 'Wet'], 300, 450, 0, 100)
+        
+        result = filter_data(reordered, *args)
+        
+        assert len(result) == 2 * len(filter_data(sample_dataframe, *args))
+
+
 class TestGetMaterialStatistics:
     """Test cases for the get_material_statistics function."""
     
@@ -127,12 +177,13 @@ class TestGetMaterialStatistics:
         result = get_material_statistics(sample_dataframe)
         
         # Check that all materials are present in the result
-        assert 'Si' in result
-        assert 'GaAs' in result
+        assert isinstance(result, pd.DataFrame)
+        assert 'Si' in result.index
+        assert 'GaAs' in result.index
         assert len(result) == 2  # Two unique materials
         
         # Check that statistics are computed correctly for Si
-        si_stats = result['Si']
+        si_stats = result.loc['Si']
         assert si_stats['Количество'] == 3
         # Check mean values (calculated from actual sample data)
         # Si thickness values: [300, 400, 350] -> mean = 350.0
@@ -151,8 +202,8 @@ class TestGetMaterialStatistics:
         result = get_material_statistics(dataframe_with_nans)
         
         # Check that Si is present
-        assert 'Si' in result
-        si_stats = result['Si']
+        assert 'Si' in result.index
+        si_stats = result.loc['Si']
         
         # NaN values should be handled gracefully
         assert si_stats['Количество'] == 3  # Total rows for Si
@@ -168,12 +219,13 @@ class TestGetCutTypeAnalysis:
         result = get_cut_type_analysis(sample_dataframe)
         
         # Check that all cut types are present in the result
-        assert 'Dry' in result
-        assert 'Wet' in result
+        assert isinstance(result, pd.DataFrame)
+        assert 'Dry' in result.index
+        assert 'Wet' in result.index
         assert len(result) == 2  # Two unique cut types
         
         # Check that analysis is computed correctly for Dry
-        dry_stats = result['Dry']
+        dry_stats = result.loc['Dry']
         assert dry_stats['Количество'] == 3  # Three Dry entries
         # Check mean values (calculated from actual sample data)
         # Dry thickness values: [300, 500, 350] -> mean = 383.33333
@@ -379,4 +431,62 @@ class TestGetPerformanceTrends:
         
         # Should return an empty dictionary since there's no data to process
         assert isinstance(result, dict)
-        assert result == {}
\ No newline at end of file
+        assert result == {}
+
+
+class TestFloat32Input:
+    """Test that float32 columns, as stored by the data loader, give float64 results."""
+    
+    def test_statistics_match_float64(self, sample_dataframe, float32_dataframe):
+        """Test that averages carry no float32 rounding noise."""
+        pd.testing.assert_frame_equal(
+            get_material_statistics(float32_dataframe), get_material_statistics(sample_dataframe)
+        )
+        pd.testing.assert_frame_equal(
+            compare_materials(float32_dataframe, ['Si', 'GaAs']), compare_materials(sample_dataframe, ['Si', 'GaAs'])
+        )
+        assert get_performance_trends(float32_dataframe) == get_performance_trends(sample_dataframe)
+    
+    def test_records_keep_source_values(self, sample_dataframe, float32_dataframe):
+        """Test that returned rows show 2.1, not 2.0999999046325684."""
+        recommendations = get_disc_recommendations(float32_dataframe, material='Si', thickness=350)
+        
+        assert recommendations == get_disc_recommendations(sample_dataframe, material='Si', thickness=350)
+        assert 2.1 in [rec['Скорость подачи (мм/с)'] for rec in recommendations]
+        pd.testing.assert_frame_equal(
+            find_optimal_settings(float32_dataframe, 'Si', 350), find_optimal_settings(sample_dataframe, 'Si', 350)
+        )
+
+
+class TestCreateSummaryMetrics:
+    """Test cases for the create_summary_metrics function."""
+    
+    METRIC_COLUMNS = [
+        'Сколы лицевая сторона (медиана), мкм',
+        'Сколы обратная сторона (медиана), мкм',
+        'Производительность, шт/час',
+        'Срок службы диска, резов'
+    ]
+    
+    def test_create_summary_metrics_matches_pandas(self, sample_dataframe):
+        """Test that the metrics are the rounded column means and the row count."""
+        result = create_summary_metrics(sample_dataframe)
+        expected = sample_dataframe[self.METRIC_COLUMNS].mean().round(2)
+        
+        assert isinstance(result, SummaryMetrics)
+        assert list(result[:4]) == expected.tolist()
+        assert result.total_records == len(sample_dataframe)
+    
+    def test_create_summary_metrics_all_nan_column(self, sample_dataframe):
+        """Test that a column without values averages to 0 instead of NaN."""
+        data = sample_dataframe.assign(**{'Сколы обратная сторона (медиана), мкм': np.nan})
+        
+        result = create_summary_metrics(data)
+        
+        assert result.avg_back_chipping == 0.0
+        assert result.avg_front_chipping == round(sample_dataframe['Сколы лицевая сторона (медиана), мкм'].mean(), 2)
+        assert result.total_records == len(sample_dataframe)
+    
+    def test_create_summary_metrics_empty_dataframe(self, empty_dataframe):
+        """Test that empty data gives zero metrics."""
+        assert create_summary_metrics(empty_dataframe) == SummaryMetrics(0.0, 0.0, 0.0, 0.0, 0)
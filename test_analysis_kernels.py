@@ -0,0 +1,123 @@
+"""
+Tests for the array kernels behind the analysis functions.
+"""
+import warnings
+
+import numpy as np
+
+from disc_cutting_analyzer.analysis_kernels import filter_mask, linear_fit, nan_column_means, topk_indices
+
+
+class TestFilterMask:
+    """Test cases for the filter_mask kernel."""
+    
+    def test_filter_mask_codes_and_ranges(self):
+        """Test membership on integer codes combined with inclusive ranges."""
+        material_codes = np.array([0, 1, 0, -1, 0])
+        cut_codes = np.array([0, 0, 1, 0, 0])
+        thickness = np.array([300.0, 300.0, 300.0, 300.0, np.nan])
+        kerf_width = np.array([30.0, 30.0, 30.0, 30.0, 30.0])
+        
+        result = filter_mask(
+            material_codes, np.array([0]), cut_codes, np.array([0]),
+            thickness, kerf_width, 300, 400, 30, 35
+        )
+        
+        # Other material, other cut type, missing material and NaN thickness are excluded
+        assert result.tolist() == [True, False, False, False, False]
+    
+    def test_filter_mask_sorted_thickness(self):
+        """Test that the binary search path matches the full comparison."""
+        material_codes = np.array([0, 0, 1, 0, 0, 0])
+        cut_codes = np.zeros(6, dtype=int)
+        thickness = np.array([200.0, 300.0, 300.0, 350.0, 400.0, np.nan])
+        kerf_width = np.array([30.0, 30.0, 30.0, 40.0, 30.0, 30.0])
+        
+        for bounds in [(300, 400), (250, 260), (0, 1000), (400, 300)]:
+            args = (material_codes, np.array([0]), cut_codes, np.array([0]),
+                    thickness, kerf_width, *bounds, 30, 35)
+            expected = filter_mask(*args)
+            assert filter_mask(*args, thickness_sorted=True).tolist() == expected.tolist()
+    
+    def test_filter_mask_single_and_multiple_codes(self):
+        """Test that one selected code and several selected codes agree with np.isin."""
+        codes = np.array([0, 1, 2, -1, 1], dtype=np.int8)
+        values = np.full(5, 300.0)
+        
+        for selected in [np.array([1]), np.array([0, 2]), np.array([], dtype=int)]:
+            result = filter_mask(codes, selected, codes, selected, values, values, 0, 1000, 0, 1000)
+            assert result.tolist() == np.isin(codes, selected).tolist()
+
+
+class TestTopkIndices:
+    """Test cases for the topk_indices kernel."""
+    
+    def test_topk_indices_ranking(self):
+        """Test ranking by distance, then by performance descending."""
+        thickness = np.array([300.0, 350.0, 400.0, 350.0, 500.0])
+        performance = np.array([100.0, 110.0, 120.0, 130.0, 90.0])
+        
+        result = topk_indices(thickness, performance, 350, 3)
+        
+        # Both 350 μm rows first, then the 300/400 tie; higher performance wins each tie
+        assert list(result) == [3, 1, 2]
+    
+    def test_topk_indices_fewer_rows_than_k(self):
+        """Test that all rows are returned when k exceeds the row count."""
+        result = topk_indices(np.array([300.0, np.nan]), np.array([1.0, 2.0]), 350, 10)
+        
+        # Rows with unknown thickness go last
+        assert list(result) == [0, 1]
+    
+    def test_topk_indices_chipping_tiebreak(self):
+        """Test that lower chipping breaks distance and performance ties."""
+        thickness = np.array([350.0, 350.0, 350.0])
+        performance = np.array([100.0, 100.0, 100.0])
+        chipping = np.array([12.0, 8.0, 10.0])
+        
+        result = topk_indices(thickness, performance, 350, 2, chipping=chipping)
+        
+        assert list(result) == [1, 2]
+
+
+class TestLinearFit:
+    """Test cases for the linear_fit kernel."""
+    
+    def test_linear_fit_matches_polyfit(self):
+        """Test that the closed form agrees with np.polyfit."""
+        x = np.array([300.0, 350.0, 400.0, 500.0], dtype=np.float32)
+        y = np.array([5.0, 7.5, 6.0, 9.0], dtype=np.float32)
+        
+        slope, intercept = linear_fit(x, y)
+        
+        assert np.allclose([slope, intercept], np.polyfit(x, y, 1))
+    
+    def test_linear_fit_constant_x(self):
+        """Test that identical x values give a flat line through the mean."""
+        slope, intercept = linear_fit(np.array([300.0, 300.0]), np.array([4.0, 6.0]))
+        
+        assert slope == 0.0
+        assert intercept == 5.0
+
+
+class TestNanColumnMeans:
+    """Test cases for the nan_column_means kernel."""
+    
+    def test_nan_column_means_skips_nan(self):
+        """Test per-column means that ignore NaN, with 0 for empty columns."""
+        values = np.array([
+            [1.0, np.nan, 2.0],
+            [3.0, np.nan, np.nan],
+        ])
+        
+        result = nan_column_means(values)
+        
+        np.testing.assert_allclose(result, [2.0, 0.0, 2.0])
+    
+    def test_nan_column_means_no_rows(self):
+        """Test that an empty block gives zeros without warnings."""
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            result = nan_column_means(np.empty((0, 4)))
+        
+        np.testing.assert_array_equal(result, np.zeros(4))
@@ -0,0 +1,115 @@
+"""
+Tests for the on-disk cache of parsed workbooks.
+"""
+import os
+
+import pandas as pd
+from pandas.api.types import is_integer_dtype
+import pytest
+
+from disc_cutting_analyzer import data_loader
+from disc_cutting_analyzer.data_loader import (
+    CACHE_DIR_ENV, _disk_cache_path, _load_workbook, _read_disk_cache, _write_disk_cache
+)
+
+
+@pytest.fixture
+def workbook(tmp_path, monkeypatch):
+    """Write a small two-sheet workbook and point the cache at a temporary directory."""
+    monkeypatch.setenv(CACHE_DIR_ENV, str(tmp_path / 'cache'))
+    path = tmp_path / 'workbook.xlsx'
+    with pd.ExcelWriter(path, engine='openpyxl') as writer:
+        pd.DataFrame({
+            'Материал пластины': ['Si', 'Si', 'Si'],
+            'Тип резки': ['Сквозной', 'Сквозной', 'Сквозной'],
+            'Толщина пластины, мкм': [300, 100, 200],
+            'Частота оборотов шпинделя, об/мин': [30000, 45000, 40000],
+            'Скорость подачи, мм/с': [2.1, 2.5, 0.7]
+        }).to_excel(writer, sheet_name='Si', index=False)
+        pd.DataFrame({
+            'Материал пластины': ['GaAs', 'GaAs'],
+            'Тип резки': ['Сквозной', 'Сквозной'],
+            'Толщина пластины, мкм': [150, None],
+            'Частота оборотов шпинделя, об/мин': [35000, 32000],
+            'Скорость подачи, мм/с': [1.8, 2.2]
+        }).to_excel(writer, sheet_name='GaAs', index=False)
+    return str(path)
+
+
+def test_cache_path_location_and_version(workbook, tmp_path, monkeypatch):
+    """Test that caches go to the configured directory and are keyed by version and source."""
+    cache_path = _disk_cache_path(workbook)
+    
+    assert os.path.dirname(cache_path) == str(tmp_path / 'cache')
+    assert cache_path.endswith(f'.v{data_loader.DISK_CACHE_VERSION}.pkl')
+    assert _disk_cache_path(str(tmp_path / 'other' / 'workbook.xlsx')) != cache_path
+    
+    monkeypatch.setattr(data_loader, 'DISK_CACHE_VERSION', data_loader.DISK_CACHE_VERSION + 1)
+    assert _disk_cache_path(workbook) != cache_path
+
+
+def test_load_workbook_writes_and_reuses_cache(workbook):
+    """Test that the first load writes the cache and the next load reads it."""
+    loaded = _load_workbook(workbook)
+    cache_path = _disk_cache_path(workbook)
+    
+    assert len(loaded) == 5
+    assert loaded['Толщина пластины, мкм'].iloc[:4].tolist() == [100, 150, 200, 300]
+    assert os.listdir(os.path.dirname(cache_path)) == [os.path.basename(cache_path)]
+    
+    pd.testing.assert_frame_equal(_read_disk_cache(cache_path, workbook), loaded)
+
+
+def test_whole_number_columns_stay_integers(workbook):
+    """Test that whole-number columns are not exported as 45000.0."""
+    loaded = _load_workbook(workbook)
+    
+    assert is_integer_dtype(loaded['Частота оборотов шпинделя, об/мин'])
+    assert loaded['Скорость подачи, мм/с'].dtype == 'float32'
+    # Thickness has a gap, so it stays a float column
+    assert loaded['Толщина пластины, мкм'].dtype == 'float32'
+    
+    csv_lines = loaded.to_csv(index=False).splitlines()
+    assert csv_lines[1].endswith(',45000,2.5,Si')
+
+
+def test_stale_cache_is_ignored(workbook):
+    """Test that a cache older than its workbook is not read."""
+    cache_path = _disk_cache_path(workbook)
+    _write_disk_cache(pd.DataFrame({'a': [1]}), cache_path)
+    
+    cache_mtime = os.path.getmtime(cache_path)
+    os.utime(workbook, (cache_mtime + 10, cache_mtime + 10))
+    
+    assert _read_disk_cache(cache_path, workbook) is None
+    assert len(_load_workbook(workbook)) == 5
+
+
+def test_corrupt_cache_falls_back_to_workbook(workbook):
+    """Test that an unreadable cache is re-parsed from the workbook and rewritten."""
+    cache_path = _disk_cache_path(workbook)
+    os.makedirs(os.path.dirname(cache_path))
+    with open(cache_path, 'wb') as cache_file:
+        cache_file.write(b'not a pickle')
+    
+    assert _read_disk_cache(cache_path, workbook) is None
+    
+    loaded = _load_workbook(workbook)
+    
+    assert len(loaded) == 5
+    pd.testing.assert_frame_equal(pd.read_pickle(cache_path), loaded)
+
+
+def test_failed_cache_write_is_ignored(workbook, monkeypatch):
+    """Test that a frame that cannot be pickled leaves no cache or temp file behind."""
+    def fail_to_pickle(self, path):
+        raise TypeError('cannot pickle')
+    
+    monkeypatch.setattr(pd.DataFrame, 'to_pickle', fail_to_pickle)
+    cache_path = _disk_cache_path(workbook)
+    
+    _write_disk_cache(pd.DataFrame({'a': [1]}), cache_path)
+    
+    assert os.listdir(os.path.dirname(cache_path)) == []
+    assert len(_load_workbook(workbook)) == 5
+    assert os.listdir(os.path.dirname(cache_path)) == []
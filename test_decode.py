@@ -0,0 +1,53 @@
+"""
+Tests for disc article decoding.
+"""
+import numpy as np
+import pandas as pd
+
+from disc_cutting_analyzer.decrypting import ARTICLE_FIELDS, decode_article, decode_articles
+
+
+def test_decode_articles_matches_decode_article():
+    """Test that the vectorized decoder agrees with decode_article row by row."""
+    articles = pd.Series(
+        [
+            '00757-1130-250-100',   # valid
+            '00757-A5A1-300-200',   # valid, exposure code missing from the table
+            '00757-Z130-250-100',   # valid layout, unknown grit code
+            '00757-1130-250-1000',  # one character too long
+            'abc',
+            '',
+            '00757-1130-250-100',   # repeated article
+        ],
+        index=[10, 11, 12, 13, 14, 15, 16]
+    )
+    
+    decoded = decode_articles(articles)
+    
+    assert decoded.index.equals(articles.index)
+    for index, article in articles.items():
+        assert decoded.loc[index].to_dict() == decode_article(article)
+
+
+def test_decode_articles_missing_values():
+    """Test that NaN and None articles decode to empty fields instead of failing."""
+    articles = pd.Series(['00757-1130-250-100', None, np.nan])
+    
+    decoded = decode_articles(articles)
+    
+    assert len(decoded) == 3
+    assert decoded.loc[0].to_dict() == decode_article('00757-1130-250-100')
+    for index in (1, 2):
+        assert (decoded.loc[index, list(ARTICLE_FIELDS)] == '').all()
+
+
+def test_decode_article_returns_independent_copies():
+    """Test that changing a decoded result does not leak into the memoized one."""
+    article = '00757-1130-250-100'
+    first = decode_article(article)
+    expected = dict(first)
+    
+    first['grit_size'] = 'changed'
+    first['extra'] = 'added'
+    
+    assert decode_article(article) == expected
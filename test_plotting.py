@@ -0,0 +1,107 @@
+"""
+Tests for the figure builders and their trace dicts.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from disc_cutting_analyzer.plotting import (
+    MIN_TREND_POINTS,
+    _marker_and_trend_traces,
+    create_chipping_plot,
+    create_disc_parameters_plot,
+    create_performance_plot,
+    create_process_parameters_plot
+)
+
+
+@pytest.fixture(scope='module')
+def group_rows():
+    """Rows of one (material, cut type) pair with a gap in the plotted column."""
+    return pd.DataFrame({
+        'Толщина пластины, мкм': np.array([100, 200, 300, 400, 500, 600], dtype=np.float32),
+        'Производительность, шт/час': np.array([50.0, 45.0, np.nan, 35.0, 30.0, 24.0], dtype=np.float32)
+    })
+
+
+def test_marker_trace(group_rows):
+    """Test that the marker trace is a scattergl trace of the non-missing points on its row's axes."""
+    traces = _marker_and_trend_traces(group_rows, 'Производительность, шт/час', 2, 'Si (Dry) - Performance', 'Si-Dry')
+    marker = traces[0]
+    
+    assert marker['type'] == 'scattergl'
+    assert marker['mode'] == 'markers'
+    assert (marker['xaxis'], marker['yaxis']) == ('x2', 'y2')
+    assert marker['x'].tolist() == [100, 200, 400, 500, 600]
+    assert marker['y'].tolist() == [50, 45, 35, 30, 24]
+    assert marker['legendgroup'] == 'Si-Dry'
+    assert marker['showlegend']
+
+
+def test_trend_line_spans_x_range(group_rows):
+    """Test that the trend line is the least-squares line drawn through its two end points."""
+    traces = _marker_and_trend_traces(group_rows, 'Производительность, шт/час', 1, 'Si (Dry) - Performance', 'Si-Dry')
+    marker, trend = traces
+    slope, intercept = np.polyfit(marker['x'].astype(np.float64), marker['y'].astype(np.float64), 1)
+    
+    assert trend['type'] == 'scatter'
+    assert trend['mode'] == 'lines'
+    assert (trend['xaxis'], trend['yaxis']) == ('x', 'y')
+    assert trend['name'] == 'Si (Dry) - Performance Trend'
+    assert not trend['showlegend']
+    assert trend['x'].tolist() == [100, 600]
+    np.testing.assert_allclose(trend['y'], slope * np.array([100, 600]) + intercept, rtol=1e-5)
+
+
+def test_trend_line_needs_min_points(group_rows):
+    """Test that groups with fewer than MIN_TREND_POINTS points get markers only."""
+    few_rows = group_rows.dropna().head(MIN_TREND_POINTS - 1)
+    
+    traces = _marker_and_trend_traces(few_rows, 'Производительность, шт/час', 1, 'Si (Dry) - Performance', 'Si-Dry')
+    
+    assert [trace['type'] for trace in traces] == ['scattergl']
+
+
+def test_no_traces_without_values(group_rows):
+    """Test that a column without values gives no traces."""
+    empty_rows = group_rows.assign(**{'Производительность, шт/час': np.nan})
+    
+    traces = _marker_and_trend_traces(empty_rows, 'Производительность, шт/час', 1, 'Si (Dry) - Performance', 'Si-Dry')
+    
+    assert traces == []
+
+
+def test_chipping_plot_traces():
+    """Test that the figure draws markers per group and trend lines only for groups with enough points."""
+    data = pd.DataFrame({
+        'Материал пластины': ['Si'] * MIN_TREND_POINTS + ['GaAs'] * 2,
+        'Тип резки': ['Dry'] * (MIN_TREND_POINTS + 2),
+        'Толщина пластины, мкм': np.arange(MIN_TREND_POINTS + 2, dtype=np.float32) * 100,
+        'Сколы лицевая сторона (медиана), мкм': np.arange(MIN_TREND_POINTS + 2, dtype=np.float32),
+        'Сколы обратная сторона (медиана), мкм': np.arange(MIN_TREND_POINTS + 2, dtype=np.float32)
+    })
+    
+    fig = create_chipping_plot(data, ['Si', 'GaAs'], ['Dry'])
+    
+    assert [(trace.type, trace.name) for trace in fig.data] == [
+        ('scattergl', 'Si (Dry) - Front Side'),
+        ('scatter', 'Si (Dry) - Front Side Trend'),
+        ('scattergl', 'Si (Dry) - Back Side'),
+        ('scatter', 'Si (Dry) - Back Side Trend'),
+        ('scattergl', 'GaAs (Dry) - Front Side'),
+        ('scattergl', 'GaAs (Dry) - Back Side')
+    ]
+
+
+@pytest.mark.parametrize('builder, args', [
+    (create_chipping_plot, (['Si'], ['Dry'])),
+    (create_performance_plot, (['Si'], ['Dry'])),
+    (create_process_parameters_plot, (['Si'], ['Dry'])),
+    (create_disc_parameters_plot, (100, 500))
+])
+def test_placeholder_for_empty_data(builder, args):
+    """Test that every builder returns the placeholder figure for empty data."""
+    fig = builder(pd.DataFrame(), *args)
+    
+    assert len(fig.data) == 0
+    assert [annotation.text for annotation in fig.layout.annotations] == ['No data available for selected filters']